@@ -0,0 +1,69 @@
+"""
+Benchmark of the table parser used by Tables.get_table_dataframe
+
+Compares the previous parsing path (NumPy string array + pd.to_numeric per column) with the schema-driven
+columnar parser on a synthetic result table shaped like "Joint Displacements".
+
+Usage:
+    python benchmarks/bench_table_parser.py [number_records]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from pyCSI.utils import parse_table_array
+
+
+FIELDS = ['Story', 'Label', 'UniqueName', 'OutputCase', 'CaseType', 'StepType', 'StepNum',
+          'Ux', 'Uy', 'Uz', 'Rx', 'Ry', 'Rz']
+UNITS = ['', '', '', '', '', '', '', 'in', 'in', 'in', 'rad', 'rad', 'rad']
+
+
+def build_table(number_records: int) -> tuple[str, ...]:
+    '''Builds a flat table array as returned by GetTableForDisplayArray'''
+
+    rng = np.random.default_rng(0)
+    rows = []
+    for index in range(number_records):
+        rows.extend([f'Story{index % 40}', str(index % 500), str(index % 5000), f'TH{index % 7}',
+                     'LinModHist', 'Step', str(index % 200)])
+        rows.extend(f'{value:.6E}' for value in rng.standard_normal(6))
+    return tuple(rows)
+
+
+def legacy_parse(table_data, headers, number_records) -> pd.DataFrame:
+    '''Parsing path used before the columnar parser'''
+
+    data = np.array(table_data)
+    data = data.reshape(number_records, len(headers))
+    table = pd.DataFrame(data, columns=headers)
+    for column in table:
+        try:
+            table[column] = pd.to_numeric(table[column])
+        except ValueError:
+            pass
+    return table
+
+
+def main(number_records: int = 200_000) -> None:
+    table_data = build_table(number_records)
+
+    legacy = legacy_parse(table_data, FIELDS, number_records)
+    columnar = parse_table_array(table_data, FIELDS, number_records, units=UNITS)
+    pd.testing.assert_frame_equal(legacy, columnar, check_dtype=False)
+
+    legacy_time = min(timeit.repeat(lambda: legacy_parse(table_data, FIELDS, number_records), number=1, repeat=3))
+    columnar_time = min(timeit.repeat(lambda: parse_table_array(table_data, FIELDS, number_records, units=UNITS),
+                                      number=1, repeat=3))
+
+    print(f'Records: {number_records}')
+    print(f'Legacy parser:   {legacy_time:.3f} s')
+    print(f'Columnar parser: {columnar_time:.3f} s')
+    print(f'Speed up:        {legacy_time / columnar_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -42,6 +42,9 @@ class File:
 
         return_code = self._file.OpenFile(file)
         check_request(return_code)
+
+        # Instantiate the model components again to clear cached model data
+        self._parent._set_model_object(self._parent.get_model_object())
         print(f'Successfully connected to {self._parent.get_file_name()}')
 
     def new_model(self):
@@ -51,6 +54,9 @@ class File:
         return_code: int = model_object.InitializeNewModel()
         check_request(return_code)
 
+        # Instantiate the model components again to clear cached model data
+        self._parent._set_model_object(model_object)
+
     def save(self, file_name: Optional[str] = None, path: Optional[Path | str] = None) -> None:
         """Saves the model with the specified path and file name.
 
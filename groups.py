@@ -6,9 +6,23 @@ PyCSI Groups component
 The Group component gives access to the model CSI API Group Interface
 """
 
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Iterator
+from typing import Literal
+from typing import Optional
+
 import pandas as pd
 
+from pyCSI.components.group_membership import GroupMembership
+from pyCSI.components.label_index import LabelIndex
+from pyCSI.enums import ItemType
+from pyCSI.enums import ReturnCode
 from pyCSI.protocols import IModel
+from pyCSI.utils import APIBadRequest
 from pyCSI.utils import check_request
 
 
@@ -19,9 +33,35 @@ class Groups:
         parent (Model): Instance of a PyCSI Model class.
     """
 
+    GROUP_ASSIGNMENTS_TABLE = 'Group Assignments'
+    TABLE_OBJECT_TYPES = {'frame': 'Frame', 'area': 'Area', 'joint': 'Joint', 'link': 'Link'}
+    TABLE_OBJECT_TYPE_ALIASES = {'point': 'joint'}
+    GROUP_RULES = {'story': [('Frame Assignments - Summary', 'Story', 'frame'),
+                             ('Area Assignments - Summary', 'Story', 'area'),
+                             ('Point Object Connectivity', 'Story', 'joint'),
+                             ('Link Assignments - Summary', 'Story', 'link')],
+                   'section': [('Frame Assignments - Sections', 'AnalysisSect', 'frame'),
+                               ('Area Assignments - Sections', 'Section', 'area')],
+                   'pier': [('Frame Assignments - Pier Labels', 'PierName', 'frame'),
+                            ('Area Assignments - Pier Labels', 'PierName', 'area')],
+                   'spandrel': [('Frame Assignments - Spandrel Labels', 'SpandrelName', 'frame'),
+                                ('Area Assignments - Spandrel Labels', 'SpandrelName', 'area')]}
+
     def __init__(self, parent) -> None:
         self._parent = parent
         self._model_object: IModel = parent.get_model_object()
+        self._group_names: set[str] | None = None
+        self._label_index: LabelIndex | None = None
+        self._assignments: dict[str, tuple[int, GroupMembership]] = {}
+
+    @property
+    def label_index(self) -> LabelIndex:
+        """Gets the index used to resolve object labels and stories into
+        unique names. See `LabelIndex` for available methods."""
+
+        if self._label_index is None:
+            self._label_index = LabelIndex(self._parent.tables)
+        return self._label_index
 
     def create(self, group_name: str):
         """Defines a new group definition"""
@@ -29,16 +69,324 @@ class Groups:
         return_code = self._model_object.GroupDef.SetGroup_1(group_name)
         check_request(return_code)
 
+        if self._group_names is not None:
+            self._group_names.add(group_name)
+        self._assignments.pop(group_name, None)
+
+    def delete(self, group_name: str):
+        """Deletes a group definition"""
+
+        return_code = self._model_object.GroupDef.Delete(group_name)
+        check_request(return_code)
+
+        if self._group_names is not None:
+            self._group_names.discard(group_name)
+        self._assignments.pop(group_name, None)
+
     def get_names(self) -> list[str]:
-        """Gets a list of all defined groups in the model"""
+        """Gets a list of all defined groups in the model. The group names
+        cache is refreshed with the returned names."""
 
         request_result = self._model_object.GroupDef.GetNameList()
         return_code = request_result[-1]
         check_request(return_code)  # Check API request
+        self._group_names = set(request_result[1])
         return request_result[1]
 
+    def exists(self, group_name: str) -> bool:
+        """Checks if a group is defined in the model. Group names are
+        requested to the CSI API only once and kept in a cache, see
+        `clear_cache()`."""
+
+        if self._group_names is None:
+            self.get_names()
+
+        return group_name in self._group_names
+
+    def clear_cache(self):
+        """Clears the cached group names and assignments. Use it if groups are
+        defined, deleted or modified outside this component."""
+
+        self._group_names = None
+        self._assignments.clear()
+
+    def get_assignments(self, group_name: str, use_cache: bool = True) -> GroupMembership:
+        """Gets the objects assigned to a group.
+
+        Snapshots are cached until the group is modified through this
+        component or model tables are edited, see `clear_cache()`.
+
+        Args:
+            group_name: Name of an existing group.
+            use_cache: If `False`, the assignments are requested to the CSI
+            API even if the group is cached. Defaults to `True`.
+
+        Returns:
+            A `GroupMembership` snapshot of the group, which supports local
+            union (|), intersection (&) and difference (-) operations.
+        """
+        revision = self._parent.tables.revision
+        cached = self._assignments.get(group_name)
+        if use_cache and cached is not None and cached[0] == revision:
+            return cached[1]
+
+        request_result = self._model_object.GroupDef.GetAssignments(group_name)
+        check_request(request_result[-1])  # Check API request
+        object_types, object_names = request_result[1:3]
+
+        membership = GroupMembership(object_types or [], object_names or [], group_name)
+        self._assignments[group_name] = (revision, membership)
+        return membership
+
+    def sync(self, group_name: str, desired_members: GroupMembership | pd.DataFrame,
+             backend: Literal['objects', 'table'] = 'objects') -> dict[str, int]:
+        """Makes the group contain exactly the specified objects, only adding
+        and removing the objects that differ from the current assignments.
+        Unlike `replace_group=True`, unchanged groups are not modified.
+
+        Args:
+            group_name: Name of the group to be synchronized. The group is
+            created if it does not exist.
+            desired_members: A `GroupMembership` or a two column DataFrame
+            containing the object\'s unique name and type. See
+            `add_object_from_name()` for valid object types.
+
+        Keyword Args:
+            backend: Method used to assign the objects, see `assign_objects()`.
+            Defaults to 'objects'.
+
+        Returns:
+            A dictionary with the number of added, removed and unchanged
+            objects, and the number of skipped objects. Cable, tendon and solid
+            objects cannot be assigned, they are skipped and left as they are
+            in the group.
+        """
+        return self.sync_many({group_name: desired_members}, backend)[group_name]
+
+    def sync_many(self, groups: dict[str, GroupMembership | pd.DataFrame],
+                  backend: Literal['objects', 'table'] = 'objects') -> dict[str, dict[str, int]]:
+        """Synchronizes several groups, see `sync()`. With the 'table' backend
+        the changes of all groups are imported in a single edit.
+
+        Args:
+            groups: Dictionary mapping each group name to its desired members.
+
+        Keyword Args:
+            backend: Method used to assign the objects, see `assign_objects()`.
+            Defaults to 'objects'.
+
+        Returns:
+            A dictionary with the sync report of each group, see `sync()`.
+        """
+        use_table = backend == 'table' and self._can_edit_assignments_table()
+        if use_table:
+            # Read the current assignments of all groups at once
+            self._load_assignments_from_table([group_name for group_name in groups if self.exists(group_name)])
+
+        # Objects of types that cannot be assigned are left out of the diff
+        assignable_types = list(self._get_assign_functions())
+        other_types = [type_name for type_name in GroupMembership.TYPE_NAMES.values()
+                       if type_name not in assignable_types]
+
+        report = {}
+        changes = {}
+        for group_name, desired_members in groups.items():
+            if isinstance(desired_members, pd.DataFrame):
+                desired_members = GroupMembership.from_dataframe(desired_members, group_name)
+
+            current_members = self.get_assignments(group_name) if self.exists(group_name) else GroupMembership([], [])
+            skipped_members = (desired_members | current_members).of_type(*other_types)
+            desired_members = desired_members.of_type(*assignable_types) | current_members.of_type(*other_types)
+
+            additions = desired_members - current_members
+            removals = current_members - desired_members
+            report[group_name] = {'added': len(additions), 'removed': len(removals),
+                                  'unchanged': len(current_members) - len(removals), 'skipped': len(skipped_members)}
+
+            if not self.exists(group_name):
+                self.create(group_name)
+            if additions or removals:
+                changes[group_name] = (additions.to_dataframe(), removals.to_dataframe(), desired_members)
+
+        if not changes:
+            return report
+
+        if use_table:
+            additions = pd.concat([frame.assign(group=group_name) for group_name, (frame, _, _) in changes.items()])
+            removals = pd.concat([frame.assign(group=group_name) for group_name, (_, frame, _) in changes.items()])
+            self._edit_assignments_table(additions, removals, set())
+        else:
+            for group_name, (additions, removals, _) in changes.items():
+                if len(additions):
+                    self.assign_objects(additions, group_name)
+                if len(removals):
+                    self.assign_objects(removals, group_name, remove=True)
+
+        # The group now matches the desired members, keep them as the cached assignments
+        revision = self._parent.tables.revision
+        for group_name, (_, _, desired_members) in changes.items():
+            self._assignments[group_name] = (revision, GroupMembership(desired_members.object_types,
+                                                                       desired_members.names, group_name))
+        return report
+
+    def copy(self, source_group: str, target_group: str, replace_group: bool = True,
+             object_types: Optional[list[str]] = None):
+        """Copies the objects of a group into another group with one request
+        per object type, regardless of the number of objects.
+
+        Args:
+            source_group: Name of the group which objects are copied.
+            target_group: Name of the group to be modified. The group is
+            created if it does not exist.
+            replace_group: If `True`, the copied objects replace the target
+            group. Otherwise, they are added to it. Ignored if the source and
+            target groups are the same. Defaults to `True`.
+            object_types: Object types to be copied, see
+            `add_object_from_name()`. Defaults to None (all object types).
+        """
+        self.merge([source_group], target_group, replace_group, object_types)
+
+    def merge(self, source_groups: list[str], target_group: str, replace_group: bool = False,
+              object_types: Optional[list[str]] = None):
+        """Adds the objects of several groups to a group, with one request per
+        source group and object type.
+
+        Args:
+            source_groups: Names of the groups which objects are added.
+            target_group: Name of the group to be modified. The group is
+            created if it does not exist.
+            replace_group: If `True`, the objects replace the target group.
+            Otherwise, they are added to it. Ignored if the target group is
+            also a source group. Defaults to `False`.
+            object_types: Object types to be added, see
+            `add_object_from_name()`. Defaults to None (all object types).
+        """
+        # A target that is also a source keeps its own objects, so it is not replaced
+        if target_group in source_groups:
+            replace_group = False
+            source_groups = [source_group for source_group in source_groups if source_group != target_group]
+
+        # If replace_group, delete and redefine group
+        if replace_group and self.exists(target_group):
+            self.delete(target_group)
+
+        for source_group in source_groups:
+            self._assign_item(source_group, target_group, False, ItemType.GROUP, object_types)
+
+    def subtract(self, target_group: str, source_groups: list[str], object_types: Optional[list[str]] = None):
+        """Removes the objects of several groups from a group, with one
+        request per source group and object type.
+
+        Args:
+            target_group: Name of the group to be modified.
+            source_groups: Names of the groups which objects are removed.
+            object_types: Object types to be removed, see
+            `add_object_from_name()`. Defaults to None (all object types).
+        """
+        for source_group in source_groups:
+            self._assign_item(source_group, target_group, True, ItemType.GROUP, object_types)
+
+    def assign_selection(self, group_name: str, replace_group: bool = False, remove: bool = False,
+                         object_types: Optional[list[str]] = None):
+        """Adds or removes the objects currently selected in the model from a
+        group, with one request per object type.
+
+        Args:
+            group_name: Name of the group to be modified.
+            replace_group: If `True`, the selected objects replace the group.
+            Otherwise, they are added to it. Defaults to `False`.
+            remove: If `True`, the selected objects are removed from the
+            group. Defaults to `False`.
+            object_types: Object types to be assigned, see
+            `add_object_from_name()`. Defaults to None (all object types).
+        """
+        # If replace_group, delete and redefine group
+        if replace_group and self.exists(group_name):
+            self.delete(group_name)
+
+        self._assign_item('', group_name, remove, ItemType.SELECTED_OBJECTS, object_types)
+
+    def create_by(self, rule: str | None = None, name_format: str = '{}',
+                  sources: list[tuple[str, str | Callable[[pd.DataFrame], pd.Series], str]] | None = None,
+                  object_types: list[str] | None = None,
+                  backend: Literal['objects', 'table'] = 'table') -> dict[str, int | dict]:
+        """Creates one group per distinct value of an object property, e.g.
+        one group per story, section, pier or spandrel label.
+
+        Each source table is read once, objects are partitioned locally and
+        all groups are synchronized with `sync_many()`, so unchanged groups
+        are not modified and, with the 'table' backend, all changes are
+        imported in a single edit.
+
+        Args:
+            rule: Name of a predefined rule, see `GROUP_RULES`. Sources of the
+            rule not available in the model are skipped. Defaults to None.
+            name_format: Format of the group names, the property value is
+            passed as the single positional argument. Defaults to '{}'.
+            sources: Custom sources used instead of a predefined rule, as a
+            list of (table key, field, object type) tuples. The field can also
+            be a function that receives the whole table and returns the group
+            value of each row, e.g. the grid line of each joint from its
+            coordinates. Rows with a null value are not assigned. Defaults to
+            None.
+            object_types: If provided, only sources of these object types are
+            used. Defaults to None (all object types).
+            backend: Method used to assign the objects, see `assign_objects()`.
+            Defaults to 'table'.
+
+        Returns:
+            A dictionary with the number of groups, created groups, changed
+            groups, added and removed objects, and the sync report of each
+            group (groups_report).
+
+        Example:
+            .. codeblock:: python
+
+                model.groups.create_by('story', name_format='Story - {}')
+                model.groups.create_by(sources=[('Frame Assignments - Summary', 'Type', 'frame')])
+        """
+        if (rule is None) == (sources is None):
+            raise ValueError('Either a rule or custom sources must be provided')
+        if rule is not None:
+            if rule not in self.GROUP_RULES:
+                raise ValueError(f'Rule {rule} is not valid. Valid rules are {", ".join(self.GROUP_RULES)}')
+            sources = self._get_available_sources(self.GROUP_RULES[rule])
+        if object_types is not None:
+            sources = [source for source in sources if source[2] in object_types]
+        if not sources:
+            raise ValueError('None of the source tables is available in the model')
+
+        # Read each source table once and get the group of each object
+        members = []
+        for table_key, field, object_type in sources:
+            columns = ['UniqueName', field] if isinstance(field, str) else None
+            table_data = self._parent.tables.get_table_dataframe(table_key, use_cache=False, columns=columns,
+                                                                 categorical=False)
+            values = table_data[field] if isinstance(field, str) else pd.Series(field(table_data))
+            members.append(pd.DataFrame({'value': values.to_numpy(),
+                                         'name': table_data['UniqueName'].astype(str).to_numpy(),
+                                         'type': object_type}))
+
+        members = pd.concat(members, ignore_index=True)
+        members = members[members['value'].notna() & (members['value'].astype(str).str.strip() != '')]
+        members['group'] = members['value'].astype(str).map(name_format.format)
+
+        # Partition objects by group and synchronize all groups at once
+        groups = {group_name: group_members[['name', 'type']]
+                  for group_name, group_members in members.groupby('group', sort=True)}
+        existing_groups = {group_name for group_name in groups if self.exists(group_name)}
+        report = self.sync_many(groups, backend)
+
+        return {'groups': len(report),
+                'created': len(set(report) - existing_groups),
+                'changed': sum(1 for changes in report.values() if changes['added'] or changes['removed']),
+                'added': sum(changes['added'] for changes in report.values()),
+                'removed': sum(changes['removed'] for changes in report.values()),
+                'groups_report': report}
+
     def add_object_from_name(self, unique_name: str, object_type: str, group_name: str,
-                             replace_group: bool = False, remove: bool = False):
+                             replace_group: bool = False, remove: bool = False,
+                             backend: Literal['objects', 'table'] = 'objects'):
         """Adds objects to a group specifying its unique name and object type.
 
         Args:
@@ -57,12 +405,15 @@ class Groups:
             Otherwise, objects will be added to the group. Defaults to `False`.
             remove: If `True`, objects will be removed from specified group.
             Defaults to `False`.
+            backend: Method used to assign the objects, see `assign_objects()`.
+            Defaults to 'objects'.
         """
+        if backend != 'objects':
+            objects = pd.DataFrame({'name': [unique_name], 'type': [object_type]})
+            self.assign_objects(objects, group_name, replace_group, remove, backend)
+            return
 
-        object_functions = {'frame': self._model_object.FrameObj.SetGroupAssign,
-                            'area': self._model_object.AreaObj.SetGroupAssign,
-                            'joint': self._model_object.PointObj.SetGroupAssign,
-                            'link': self._model_object.LinkObj.SetGroupAssign}
+        object_functions = self._get_assign_functions()
 
         # Check that object type format is consistent
         object_type = object_type.lower()
@@ -74,16 +425,17 @@ class Groups:
                 Valid types are frame, area, joint and link')
 
         # If replace_group, delete and redefine group
-        if replace_group:
-            self._model_object.GroupDef.Delete(group_name)
+        if replace_group and self.exists(group_name):
+            self.delete(group_name)
 
         # Check if group exists in the model, if not create it
-        if group_name not in self.get_names():
+        if not self.exists(group_name):
             self.create(group_name)
 
         # Add object to group
         object_function = object_functions[object_type]
         return_code = object_function(str(unique_name), group_name, remove)
+        self._assignments.pop(group_name, None)
         check_request(return_code)
 
     def add_objects_from_dataframe_names(self, objects: pd.DataFrame, group_name: str, **kwargs):
@@ -101,6 +453,9 @@ class Groups:
         Keyword Args:
             **kwargs: See `.add_object_from_name()` for remaining keyword
             arguments.
+
+        Returns:
+            The assignment report, see `assign_objects()`.
         """
 
         # Check the DataFrame is not empty
@@ -114,15 +469,85 @@ class Groups:
                 Objects must contain a two-column DataFrame with the
                 object\'s unique name and type''')
 
-        for i, _object in objects.iterrows():
-            unique_name = _object.iloc[0]
-            object_type = _object.iloc[1]
-            if i == 0:
-                # Replace group only for the first object of the dataframe
-                self.add_object_from_name(unique_name, object_type, group_name, **kwargs)
-            else:
-                remove = kwargs['remove']
-                self.add_object_from_name(unique_name, object_type, group_name, remove=remove)
+        return self.assign_objects(objects, group_name, **kwargs)
+
+    def assign_objects(self, objects: pd.DataFrame, group_name: str, replace_group: bool = False,
+                       remove: bool = False,
+                       backend: Literal['objects', 'table'] = 'objects') -> dict[str, dict[str, float]]:
+        """Adds or removes objects from a group in bulk.
+
+        The object type column is validated and normalized once, duplicated
+        objects are removed and the assignment requests are made per object
+        type.
+
+        Note:
+            Two backends are available:
+            - 'objects': One `SetGroupAssign` request per object.
+            - 'table': The whole membership change is imported through the
+            'Group Assignments' database table in a single
+            `ApplyEditedTables` request. If the table cannot be imported in
+            the current model state, the 'objects' backend is used.
+
+        Args:
+            objects: A two column Dataframe containing the object\'s unique
+            name and type. See `add_object_from_name()` for valid object
+            types.
+
+            group_name: Name of the group to be modified.
+
+        Keyword Args:
+            replace_group: If `True`, the specified objects will replace the group.
+            Otherwise, objects will be added to the group. Defaults to `False`.
+            remove: If `True`, objects will be removed from specified group.
+            Defaults to `False`.
+            backend: Method used to assign the objects, 'objects' or 'table'.
+            Defaults to 'objects'.
+
+        Returns:
+            A dictionary with the number of assigned objects (count) and the
+            elapsed time in seconds (time) of each object type. For the
+            'table' backend the time is the one of the whole table import.
+        """
+        object_functions = self._get_assign_functions()
+
+        # Normalize and validate object types
+        unique_names = objects.iloc[:, 0].astype(str)
+        object_types = objects.iloc[:, 1].astype(str).str.strip().str.lower()
+        invalid_types = ~object_types.isin(list(object_functions))
+        if invalid_types.any():
+            raise ValueError(f'Object types {sorted(set(object_types[invalid_types]))} are not valid. '
+                             'Valid types are frame, area, joint and link')
+
+        objects = pd.DataFrame({'name': unique_names.to_numpy(), 'type': object_types.to_numpy()})
+        objects = objects.drop_duplicates()
+
+        if backend == 'table' and self._can_edit_assignments_table():
+            objects.insert(0, 'group', group_name)
+            additions = None if remove else objects
+            removals = objects if remove else None
+            replaced_groups = {group_name} if replace_group else set()
+            return self._edit_assignments_table(additions, removals, replaced_groups)
+
+        # If replace_group, delete and redefine group
+        if replace_group and self.exists(group_name):
+            self.delete(group_name)
+
+        # Check if group exists in the model, if not create it
+        if not self.exists(group_name):
+            self.create(group_name)
+
+        # Add objects to group
+        report = {}
+        self._assignments.pop(group_name, None)
+        for object_type, type_objects in objects.groupby('type', sort=False):
+            object_function = object_functions[object_type]
+            start_time = time.perf_counter()
+            for unique_name in type_objects['name'].tolist():
+                return_code = object_function(unique_name, group_name, remove)
+                check_request(return_code)
+            report[object_type] = {'count': len(type_objects), 'time': time.perf_counter() - start_time}
+
+        return report
 
     def add_objects_of_same_type_from_dataframe_names(self, unique_names: pd.DataFrame, group_name: str,
                                                       object_type: str, **kwargs):
@@ -151,10 +576,10 @@ class Groups:
                 with the object\'s unique name''')
 
         # Add a second column to the unique_names DataFrame with the object type
-        unique_names['types'] = object_type
+        unique_names = unique_names.assign(types=object_type)
 
         # Add to group
-        self.add_objects_from_dataframe_names(unique_names, group_name, **kwargs)
+        return self.add_objects_from_dataframe_names(unique_names, group_name, **kwargs)
 
     def add_objects_from_clipboard_names(self, group_name: str, wait_for_user: bool = False, **kwargs):
         """Add objects to a group specifying its unique name and object type.
@@ -263,7 +688,7 @@ class Groups:
         objects = self._get_unique_names_from_dataframe_labels(objects)
 
         # Add objects to group
-        self.add_objects_from_dataframe_names(objects, group_name, **kwargs)
+        return self.add_objects_from_dataframe_names(objects, group_name, **kwargs)
 
     def add_objects_from_clipboard_labels(self, group_name: str, **kwargs):
         """Add objects to a group specifying its label and story.
@@ -289,60 +714,320 @@ class Groups:
         # Add objects to group
         self.add_objects_from_dataframe_labels(objects, group_name, **kwargs)
 
+    def add_objects_from_file(self, path: Path | str, group_name: str, columns: Literal['names', 'labels'] = 'names',
+                              header: bool = True, chunk_size: int = 50000, replace_group: bool = False,
+                              backend: Literal['objects', 'table'] = 'objects',
+                              checkpoint_file: Optional[Path | str] = None,
+                              progress: Optional[Callable[[dict], None]] = None,
+                              rows_per_edit: int = 1000000) -> dict[str, int | float]:
+        """Adds the objects listed in a CSV or Parquet file to a group.
+
+        The file is read and assigned in chunks, so memory use does not grow
+        with the file size. Objects already assigned in a previous chunk are
+        skipped and each chunk is assigned with a single `assign_objects()`
+        request. Parquet files require the `pyarrow` package.
+
+        Note:
+            The 'table' backend reads and imports the whole group assignments
+            table on each edit, so its cost grows with the table and not with
+            the chunk. Chunks are queued and imported together once
+            `rows_per_edit` objects are queued, so a file takes about one
+            edit per `rows_per_edit` objects instead of one per chunk.
+
+            If a checkpoint file is provided, the number of assigned chunks is
+            written to it after each assignment. Calling the function again with
+            the same file, group and chunk size resumes after the last
+            assigned chunk. The checkpoint file is deleted once the whole file
+            is assigned.
+
+        Args:
+            path: Path of the CSV or Parquet file. Only the first two columns
+            are used.
+            group_name: Name of the group to be modified.
+            columns: Content of the first two columns, 'names' for the
+            object's unique name and type (see `add_object_from_name()`) or
+            'labels' for the object's label and story. Defaults to 'names'.
+            header: If `True`, the first row of CSV files contains the column
+            names. Defaults to `True`.
+            chunk_size: Number of rows read and assigned at once. Defaults to
+            50000.
+            replace_group: If `True`, the objects replace the group. Ignored
+            when a run is resumed. Defaults to `False`.
+            backend: Method used to assign the objects, see `assign_objects()`.
+            Defaults to 'objects'.
+            checkpoint_file: Path of the JSON file used to resume interrupted
+            runs. Defaults to None.
+            progress: Function called after each chunk with a dictionary
+            containing the chunk number, read rows, assigned objects and
+            elapsed time in seconds. Defaults to None.
+            rows_per_edit: Number of objects queued before they are imported
+            with the 'table' backend. Defaults to 1000000.
+
+        Returns:
+            A dictionary with the number of read rows, assigned objects,
+            duplicated rows, chunks, resumed chunks and the elapsed time.
+        """
+        if columns not in ('names', 'labels'):
+            raise ValueError(f'Columns {columns} are not valid. Valid columns are names and labels')
+
+        start_time = time.perf_counter()
+        path = Path(path)
+        checkpoint = {'file': str(path.resolve()), 'group': group_name, 'chunk_size': chunk_size, 'chunks': 0}
+        resumed_chunks = 0
+        if checkpoint_file is not None:
+            checkpoint_file = Path(checkpoint_file)
+            if checkpoint_file.is_file():
+                with open(checkpoint_file, encoding='utf-8') as file:
+                    stored_checkpoint = json.load(file)
+                if {key: value for key, value in stored_checkpoint.items() if key != 'chunks'} == \
+                        {key: value for key, value in checkpoint.items() if key != 'chunks'}:
+                    resumed_chunks = stored_checkpoint['chunks']
+
+        if replace_group and not resumed_chunks and self.exists(group_name):
+            self.delete(group_name)
+
+        report = {'rows': 0, 'assigned': 0, 'duplicates': 0, 'chunks': 0, 'resumed_chunks': resumed_chunks}
+        assigned_objects = GroupMembership([], [])
+        queued_objects = GroupMembership([], [])
+        queued_chunks = 0
+        for chunk_number, chunk in enumerate(self._read_file_chunks(path, chunk_size, header)):
+            if chunk.shape[1] < 2:
+                raise ValueError(f'File {path.name} must contain at least two columns')
+
+            chunk = chunk.iloc[:, :2].dropna().astype(str)
+            if columns == 'labels':
+                chunk = self._get_unique_names_from_dataframe_labels(chunk)
+            chunk_objects = GroupMembership.from_dataframe(chunk) - assigned_objects
+            assigned_objects = assigned_objects | chunk_objects
+            report['rows'] += len(chunk)
+            report['duplicates'] += len(chunk) - len(chunk_objects)
+            report['chunks'] += 1
+
+            # Chunks assigned in a previous run only update the assigned objects
+            if chunk_number < resumed_chunks:
+                continue
+
+            # Chunks are queued and imported together with the table backend, one chunk at a time otherwise
+            queued_objects = queued_objects | chunk_objects
+            queued_chunks = chunk_number + 1
+            if backend != 'table' or len(queued_objects) >= rows_per_edit:
+                self._assign_queued_objects(queued_objects, group_name, backend, queued_chunks, report, checkpoint,
+                                            checkpoint_file)
+                queued_objects = GroupMembership([], [])
+                queued_chunks = 0
+
+            if progress is not None:
+                progress({'chunk': chunk_number + 1, 'rows': report['rows'], 'assigned': report['assigned'],
+                          'time': time.perf_counter() - start_time})
+
+        if queued_chunks:
+            self._assign_queued_objects(queued_objects, group_name, backend, queued_chunks, report, checkpoint,
+                                        checkpoint_file)
+
+        if checkpoint_file is not None:
+            checkpoint_file.unlink(missing_ok=True)
+
+        report['time'] = time.perf_counter() - start_time
+        return report
+
     ###################################################################################################################
     # Miscellaneous Methods
     ###################################################################################################################
 
-    def _get_object_type(self, label: str):
-        # Gets the type of an object based on its label
+    def _assign_queued_objects(self, objects: GroupMembership, group_name: str, backend: Literal['objects', 'table'],
+                               chunks: int, report: dict, checkpoint: dict, checkpoint_file: Path | None) -> None:
+        # Assigns the objects queued by add_objects_from_file() and saves the number of assigned chunks
 
-        # Validate that label is in string format
-        label = label.upper()
-        if not isinstance(label, str):
-            raise ValueError(f'Label {label} is not in string format')
+        if len(objects):
+            self.assign_objects(objects.to_dataframe(), group_name, backend=backend)
+        elif not self.exists(group_name):
+            self.create(group_name)
+        report['assigned'] += len(objects)
 
-        # Area objects
-        if label.startswith(('F', 'W', 'A')):
-            return 'area'
+        if checkpoint_file is not None:
+            checkpoint['chunks'] = chunks
+            self._save_checkpoint(checkpoint_file, checkpoint)
 
-        # Frame objects
-        if label.startswith(('B', 'C', 'L', 'D')):
-            return 'frame'
+    def _get_assign_functions(self) -> dict:
+        # Gets the bound group assignment function of each object type
 
-        if label.isdigit():
-            return 'joint'
+        return {'frame': self._model_object.FrameObj.SetGroupAssign,
+                'area': self._model_object.AreaObj.SetGroupAssign,
+                'joint': self._model_object.PointObj.SetGroupAssign,
+                'link': self._model_object.LinkObj.SetGroupAssign}
 
-        # If label does not match any of the above raise an error
-        raise ValueError(f'Label {label} does not match any of the object types')
+    def _can_edit_assignments_table(self) -> bool:
+        # Checks if the group assignments table can be imported in the current model state
 
-    def _get_unique_name_from_label(self, label: str, story: str) -> tuple[str, str]:
-        # Gets the unique name of an object base on its label and story.
+        catalog = self._parent.tables.catalog
+        tables = catalog.get_tables()
+        if self.GROUP_ASSIGNMENTS_TABLE not in tables:
+            return False
 
-        # Object function
-        object_functions = {'frame': self._model_object.FrameObj.GetNameFromLabel,
-                            'area': self._model_object.AreaObj.GetNameFromLabel,
-                            'joint': self._model_object.PointObj.GetNameFromLabel}
+        # Import types 2 and 3 are interactively importable, 2 only when the model is unlocked
+        import_type = tables[self.GROUP_ASSIGNMENTS_TABLE].import_type
+        if import_type < 2 or (import_type == 2 and self._parent.lock):
+            return False
 
-        # Get object type from label
-        object_type = self._get_object_type(label)
+        return self._get_assignments_table_fields() is not None
 
-        # Get unique name
-        object_function = object_functions[object_type]
-        request = object_function(label, story)
-        check_request(request[-1])
+    def _assign_item(self, name: str, group_name: str, remove: bool, item_type: ItemType,
+                     object_types: Optional[list[str]]) -> None:
+        # Assigns a group or the selected objects to a group with one request per object type
 
-        return request[0], object_type
+        object_functions = self._get_assign_functions()
+        if object_types is not None:
+            object_types = [object_type.lower() for object_type in object_types]
+            invalid_types = sorted(set(object_types) - set(object_functions))
+            if invalid_types:
+                raise ValueError(f'Object types {invalid_types} are not valid. '
+                                 'Valid types are frame, area, joint and link')
+            object_functions = {object_type: object_functions[object_type] for object_type in object_types}
 
-    def _get_unique_names_from_dataframe_labels(self, objects: pd.DataFrame) -> pd.DataFrame:
-        # Gets the unique names of the specified objects based on its labels and stories
+        # Check if group exists in the model, if not create it
+        if not self.exists(group_name):
+            self.create(group_name)
 
-        # Get unique name and object type for each object
-        unique_names = []
-        object_types = []
-        for _, _object in objects.iterrows():
-            unique_name, object_type = self._get_unique_name_from_label(_object.iloc[0], _object.iloc[1])
-            unique_names.append(unique_name)
-            object_types.append(object_type)
+        self._assignments.pop(group_name, None)
+        for object_function in object_functions.values():
+            return_code = object_function(name, group_name, remove, item_type)
+            check_request(return_code)
+
+    def _read_file_chunks(self, path: Path, chunk_size: int, header: bool) -> Iterator[pd.DataFrame]:
+        # Reads a CSV or Parquet file in chunks
+
+        if path.suffix.lower() in ('.parquet', '.pq'):
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, header=0 if header else None, dtype=str, chunksize=chunk_size,
+                                   skipinitialspace=True)
+
+    def _save_checkpoint(self, checkpoint_file: Path, checkpoint: dict) -> None:
+        # Writes the checkpoint of a file assignment
+
+        temporary_file = checkpoint_file.with_suffix(checkpoint_file.suffix + '.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary_file, checkpoint_file)
+
+    def _get_available_sources(self, sources: list[tuple[str, str, str]]) -> list[tuple[str, str, str]]:
+        # Gets the rule sources which table and fields are defined in the model
+
+        catalog = self._parent.tables.catalog
+        tables = catalog.get_tables()
+        return [(table_key, field, object_type) for table_key, field, object_type in sources
+                if table_key in tables and {'UniqueName', field}.issubset(catalog.get_fields(table_key).keys)]
+
+    def _load_assignments_from_table(self, group_names: list[str]) -> None:
+        # Caches the assignments of the specified groups reading the group assignments table once
+
+        group_names = [group_name for group_name in group_names if group_name not in self._assignments
+                       or self._assignments[group_name][0] != self._parent.tables.revision]
+        if not group_names:
+            return
+
+        group_field, type_field, name_field = self._get_assignments_table_fields()
+        assignments = self._parent.tables.get_table_dataframe(
+            self.GROUP_ASSIGNMENTS_TABLE, use_cache=False, columns=[group_field, type_field, name_field],
+            categorical=False)
+        assignments = assignments[assignments[group_field].astype(str).isin(group_names)]
+
+        type_codes = {type_name: int(code) for code, type_name in GroupMembership.TYPE_NAMES.items()}
+        object_types = self._get_table_object_types(assignments[type_field]).map(type_codes)
+
+        revision = self._parent.tables.revision
+        members = dict(tuple(pd.DataFrame({'group': assignments[group_field].astype(str).to_numpy(),
+                                           'type': object_types.to_numpy(),
+                                           'name': assignments[name_field].astype(str).to_numpy()})
+                             .dropna().groupby('group', sort=False)))
+        for group_name in group_names:
+            group_members = members.get(group_name)
+            if group_members is None:
+                membership = GroupMembership([], [], group_name)
+            else:
+                membership = GroupMembership(group_members['type'].to_numpy(), group_members['name'].to_numpy(),
+                                             group_name)
+            self._assignments[group_name] = (revision, membership)
+
+    def _get_assignments_table_fields(self) -> tuple[str, str, str] | None:
+        # Gets the group, object type and unique name field keys of the group assignments table
+
+        schema = self._parent.tables.catalog.get_fields(self.GROUP_ASSIGNMENTS_TABLE)
+        fields = []
+        for candidates in (('GroupName', 'Group'), ('ObjectType', 'Type'), ('UniqueName', 'ObjectName', 'Name')):
+            field = next((field for field in candidates if field in schema.keys), None)
+            if field is None:
+                return None
+            fields.append(field)
+        return tuple(fields)
+
+    def _get_table_object_types(self, type_labels: pd.Series) -> pd.Series:
+        # Gets the object type names (see `GroupMembership.TYPE_NAMES`) of the group assignments table labels
+
+        return type_labels.astype(str).str.strip().str.lower().replace(self.TABLE_OBJECT_TYPE_ALIASES)
+
+    def _edit_assignments_table(self, additions: pd.DataFrame | None, removals: pd.DataFrame | None,
+                                replaced_groups: set[str]) -> dict[str, dict[str, float]]:
+        # Applies group membership changes through the group assignments table in a single import. Additions
+        # and removals are DataFrames with group, name and type columns
+
+        start_time = time.perf_counter()
+        group_field, type_field, name_field = self._get_assignments_table_fields()
+
+        # Define groups that do not exist yet
+        for group_name in pd.concat([frame['group'] for frame in (additions, removals) if frame is not None]).unique():
+            if not self.exists(group_name):
+                self.create(group_name)
+
+        with self._parent.tables.edit() as editor:
+            assignments = editor.get_table(self.GROUP_ASSIGNMENTS_TABLE)
+            current_types = self._get_table_object_types(assignments[type_field])
+            current_keys = pd.MultiIndex.from_arrays([
+                assignments[group_field].astype(str),
+                current_types,
+                assignments[name_field].astype(str)])
+
+            # New rows use the object type labels found in the table
+            type_labels = dict(self.TABLE_OBJECT_TYPES)
+            type_labels.update(assignments[type_field].astype(str).groupby(current_types.to_numpy()).first().to_dict())
+
+            # Remove replaced groups and removed objects
+            keep = ~assignments[group_field].astype(str).isin(replaced_groups)
+            if removals is not None:
+                keep &= ~current_keys.isin(pd.MultiIndex.from_frame(removals[['group', 'type', 'name']]))
+
+            # Add new objects that are not assigned yet
+            assignments = assignments[keep]
+            if additions is not None:
+                additions = additions[~pd.MultiIndex.from_frame(additions[['group', 'type', 'name']]).isin(
+                    current_keys[keep.to_numpy()])]
+                new_rows = pd.DataFrame({group_field: additions['group'].to_numpy(),
+                                         type_field: additions['type'].map(type_labels).to_numpy(),
+                                         name_field: additions['name'].to_numpy()})
+                assignments = pd.concat([assignments, new_rows.reindex(columns=assignments.columns)],
+                                        ignore_index=True)
+
+            editor.set_table(self.GROUP_ASSIGNMENTS_TABLE, assignments)
+
+        import_log = editor.import_log
+        if import_log.fatal_errors or import_log.errors:
+            raise APIBadRequest(f'APIBadRequest: Group assignments import failed\n{import_log.log}',
+                                ReturnCode.UNSPECIFIED_ERROR)
+
+        # Report changes per object type
+        elapsed_time = time.perf_counter() - start_time
+        changes = pd.concat([frame for frame in (additions, removals) if frame is not None])
+        return {object_type: {'count': count, 'time': elapsed_time}
+                for object_type, count in changes['type'].value_counts(sort=False).items()}
+
+    def _get_unique_name_from_label(self, label: str, story: str) -> tuple[str, str]:
+        # Gets the unique name of an object base on its label and story.
+        return self.label_index.lookup(label, story)
 
-        objects_names = {'name': unique_names, 'type': object_types}
-        return pd.DataFrame(objects_names)
+    def _get_unique_names_from_dataframe_labels(self, objects: pd.DataFrame) -> pd.DataFrame:
+        # Gets the unique names of the specified objects based on its labels and stories
+        return self.label_index.resolve(objects)
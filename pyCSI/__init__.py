@@ -5,6 +5,9 @@ from .model import ETABSModel
 from .model import SAFEModel
 from .model import SAPModel
 
+# Analysis farm
+from .farm import AnalysisFarm
+
 # Enumerator utilities
 from .enums import ForceUnit
 from .enums import LengthUnit
@@ -14,7 +17,7 @@ from .enums import TemperatureUnit
 from .utils import APIBadRequest
 from .utils import APIConnectionError
 
-__all__ = ['ETABSModel', 'SAFEModel', 'SAPModel', 'ForceUnit',
+__all__ = ['ETABSModel', 'SAFEModel', 'SAPModel', 'AnalysisFarm', 'ForceUnit',
            'LengthUnit', 'TemperatureUnit', 'APIBadRequest', 'APIConnectionError']
 
 
@@ -1,6 +1,8 @@
 '''PyCSI components package'''
 
 from .analysis import Analysis
+from .analysis import SolverOptions
+from .analysis_job import AnalysisJob
 
 from .exceptions import (
     APIBadRequest,
@@ -9,8 +11,21 @@ from .exceptions import (
 
 from .file import File
 
+from .group_membership import GroupMembership
+
 from .groups import Groups
 
 from .helper import Helper
 
+from .label_index import LabelIndex
+
+from .table_cache import TableResultsCache
+
+from .table_catalog import TableCatalog
+
+from .table_editor import ImportLog
+from .table_editor import TableEditor
+
+from .table_view import TableView
+
 from .tables import Tables
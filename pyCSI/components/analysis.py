@@ -6,12 +6,48 @@ PyCSI Analysis component
 The Analysis component gives access to the model CSI API Analyze Interface
 """
 
+import ctypes
+import functools
+import hashlib
+import heapq
+import json
+import os
+import shutil
+import signal
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Literal
+from typing import NamedTuple
 from typing import Optional
 
+import comtypes
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from pyCSI.components.analysis_job import AnalysisJob
+from pyCSI.components.tables import TableRequest
+from pyCSI.enums import CaseStatus
+from pyCSI.enums import ReturnCode
+from pyCSI.enums import SolverProcessType
+from pyCSI.enums import SolverType
 from pyCSI.protocols import IAnalysis
+from pyCSI.utils import APIBadRequest
 from pyCSI.utils import check_request
 
 
+class SolverOptions(NamedTuple):
+    """Solver options of the model, see `Analysis.solver_options`"""
+
+    solver_type: SolverType = SolverType.ADVANCED
+    process_type: SolverProcessType = SolverProcessType.AUTO
+    parallel_runs: int = 0
+    response_file_size_max_mb: int = 0
+    analysis_threads: int = 0
+    stiffness_case: str = ''
+
+
 class Analysis:
     """Analysis interface of the Model object.
 
@@ -22,18 +58,428 @@ class Analysis:
     def __init__(self, parent) -> None:
         self._parent = parent
         self._analyze: IAnalysis = parent.get_model_object().Analyze
+        self._run_flags: dict[str, bool] | None = None
+        self._last_run: dict | None = None
+        self._fingerprint_file: Path | None = None
+        self._case_costs: dict[str, float] = {}
+
+    ###################################################################################################################
+    # Class properties
+    ###################################################################################################################
+
+    @property
+    def fingerprint_file(self) -> Path | None:
+        """Gets and sets the JSON file used to keep the fingerprint of the
+        last analysis run between sessions. Defaults to None (fingerprint is
+        kept in memory only)."""
+        return self._fingerprint_file
+
+    @property
+    def last_run(self) -> dict | None:
+        """Gets the fingerprint, fingerprint method, run cases and finish time
+        of the last analysis run of the model, if any"""
+
+        if self._last_run is None and self._fingerprint_file is not None and self._fingerprint_file.is_file():
+            with open(self._fingerprint_file, encoding='utf-8') as file:
+                self._last_run = json.load(file).get(self._parent.get_file_name(include_path=True))
+
+        return self._last_run
+
+    @property
+    def case_costs(self) -> dict[str, float]:
+        """Gets the estimated run time in seconds of each load case, measured
+        by the last `run_distributed()` call"""
+        return dict(self._case_costs)
+
+    @property
+    def solver_options(self) -> SolverOptions:
+        """Gets and sets the solver options of the model.
+
+        Note:
+            Parallel runs must be between -8 and 8, excluding -1. Negative
+            values and 0 let the program choose up to that number of runs
+            (0 for the number of physical cores), 1 runs cases serially.
+            Analysis threads of 0 or less are automatic.
+        """
+        request_result = self._analyze.GetSolverOption_3()
+        check_request(request_result[-1])  # Check API request
+        solver_type, process_type, *options = request_result[:6]
+        return SolverOptions(SolverType(solver_type), SolverProcessType(process_type), *options)
+
+    @fingerprint_file.setter
+    def fingerprint_file(self, new_value: Optional[Path | str]):
+        self._fingerprint_file = None if new_value is None else Path(new_value)
+        self._last_run = None
+
+    @solver_options.setter
+    def solver_options(self, new_value: SolverOptions):
+        if not -8 <= new_value.parallel_runs <= 8 or new_value.parallel_runs == -1:
+            raise ValueError(f'Parallel runs {new_value.parallel_runs} is not valid. '
+                             'Valid values are between -8 and 8, excluding -1')
+
+        return_code = self._analyze.SetSolverOption_3(int(new_value.solver_type), int(new_value.process_type),
+                                                      *new_value[2:])
+        check_request(return_code)
+
+    ###################################################################################################################
+    # Class methods
+    ###################################################################################################################
 
-    def run_analysis(self) -> None:
-        """Runs the analysis for the model object"""
+    def run_analysis(self, only_if_stale: bool = False,
+                     fingerprint_method: Literal['tables', 'file'] = 'tables') -> bool:
+        """Runs the analysis for the model object.
+
+        The fingerprint of the run is only recorded when freshness tracking
+        is enabled, either with `only_if_stale` or with a `fingerprint_file`.
+
+        Args:
+            only_if_stale: If `True`, the analysis is only run if the results
+            are not current, see `is_stale()`. Defaults to `False`.
+            fingerprint_method: Method used to fingerprint the model, see
+            `get_fingerprint()`. Defaults to 'tables'.
+
+        Returns:
+            `True` if the analysis was run, `False` if it was skipped.
+        """
+        if only_if_stale and not self.is_stale(fingerprint_method):
+            print('Analysis results are current, analysis skipped')
+            return False
 
         print('Running analysis...')
         return_code = self._analyze.RunAnalysis()
         check_request(return_code)
+
+        # The model is locked once the analysis is run, shared table data is no longer valid
+        self._parent._lock = True
+        self._parent.tables.clear_views()
+        self._record_run(fingerprint_method, only_if_stale)
         print('Analysis finished!')
+        return True
+
+    def is_stale(self, fingerprint_method: Literal['tables', 'file'] = 'tables') -> bool:
+        """Checks if the analysis results of the model are not current.
+
+        Results are stale if the model is unlocked, if any case set to run
+        has not finished, or if the model fingerprint or run flags changed
+        since the last analysis run.
+
+        Args:
+            fingerprint_method: Method used to fingerprint the model, see
+            `get_fingerprint()`. Defaults to 'tables'.
+        """
+        last_run = self.last_run
+        if last_run is None or last_run['method'] != fingerprint_method or not self._parent.lock:
+            return True
+
+        run_flags = self.get_run_flags(use_cache=False)
+        case_status = self.get_case_status()
+        if any(run and case_status.get(case) != CaseStatus.FINISHED for case, run in run_flags.items()):
+            return True
+
+        return self._get_fingerprint(fingerprint_method, run_flags) != last_run['fingerprint']
+
+    def get_fingerprint(self, method: Literal['tables', 'file'] = 'tables') -> str:
+        """Gets the fingerprint of the model definition and run flags.
+
+        Args:
+            method: 'tables' hashes the content of all importable database
+            tables, so unsaved changes are detected. 'file' hashes the model
+            file, which is faster but only reflects the saved model. Defaults
+            to 'tables'.
+
+        Returns:
+            The SHA-256 fingerprint in hexadecimal format.
+        """
+        return self._get_fingerprint(method, self.get_run_flags(use_cache=False))
+
+    def start(self, runner: Optional[Callable[[], int]] = None) -> AnalysisJob:
+        """Starts the analysis of the model in a background thread and
+        returns immediately.
+
+        Note:
+            The analysis interface is marshaled into the background thread,
+            so the analysis can be started from single-threaded and
+            multithreaded COM apartments.
+
+            The CSI API cannot stop a running analysis. `AnalysisJob.cancel()`
+            terminates the instance of the software, which is only possible
+            for models attached by process ID (see `ETABSModel.get_model()`),
+            otherwise it returns `False`. Unsaved changes of the model are
+            lost and the model is disconnected.
+
+        Args:
+            runner: Function that runs the analysis and returns the CSI API
+            return code. Defaults to None (`RunAnalysis` of the model).
+
+        Returns:
+            An `AnalysisJob` handle with `done()`, `result(timeout)`,
+            `cancel()`, elapsed time and progress estimate of the analysis.
+
+        Example:
+            .. codeblock:: python
+
+                job = model.analysis.start()
+                while not job.done():
+                    print(f'{job.progress:.0%} {job.status}')
+                    time.sleep(5)
+                job.result()
+        """
+        log_file = Path(self._parent.get_file_name(include_path=True)).with_suffix('.LOG')
+
+        cases_to_run = sum(self.get_run_flags().values())
+
+        # The model is locked once the analysis is run, shared table data is no longer valid
+        def on_finish():
+            self._parent._lock = True
+            self._parent.tables.clear_views()
+            self._record_run('tables', False)
+
+        if runner is None:
+            runner = functools.partial(self._run_analysis_in_thread, _marshal_interface(self._analyze),
+                                       type(self._analyze))
+
+        # Only instances attached by process ID can be terminated
+        canceller = None
+        if self._parent.pid is not None:
+            canceller = functools.partial(self._terminate_instance, self._parent.pid)
+        return AnalysisJob(runner, log_file, cases_to_run, on_finish, canceller)
+
+    def run_distributed(self, n_workers: int, tables: list[str | TableRequest | tuple],
+                        case_costs: Optional[dict[str, float]] = None,
+                        working_directory: Optional[Path | str] = None, keep_files: bool = False,
+                        timeout: Optional[float] = None, **farm_options) -> dict[str, pd.DataFrame]:
+        """Runs the analysis of the load cases set to run split among several
+        copies of the model, each one analyzed by its own instance of the
+        software, and returns the requested tables of all the copies.
+
+        The model is saved and copied to one working folder per worker. Each
+        copy runs a disjoint set of load cases, balanced by their estimated
+        cost, and its tables are extracted for its own load cases. Rows of
+        all the copies are merged in the order of a single run: by the fields
+        preceding the load case (e.g. story and object) in the order they
+        appear, then by load case.
+
+        Note:
+            Results of the current model are not modified. Load combinations
+            are not selected for display, since their cases may be run by
+            different copies. Cases depending on others (e.g. nonlinear
+            staged cases) must be run by the same copy, the analysis of a
+            copy runs the cases they depend on.
+
+        Args:
+            n_workers: Number of copies of the model analyzed in parallel.
+            tables: Table requests extracted from each copy, see
+            `Tables.get_tables()`. Load case selection of the requests is
+            replaced by the cases of each copy.
+            case_costs: Estimated cost of each load case (e.g. run time) used
+            to balance the copies. Defaults to None, which uses `case_costs`
+            measured by the last distributed run and 1 for unknown cases.
+            working_directory: Folder where the working folders of the copies
+            are created. Defaults to None (a temporary folder).
+            keep_files: If `True`, the copies of the model are kept after the
+            analysis. Defaults to `False`.
+            timeout: Timeout of the analysis of each copy in seconds. Defaults
+            to None (no timeout).
+            farm_options: Additional arguments of the `AnalysisFarm` (e.g.
+            `instance_factory`).
+
+        Returns:
+            A dictionary mapping each request name to its table data of all
+            the copies in `DataFrame` format.
+
+        Example:
+            .. codeblock:: python
+
+                drifts = model.analysis.run_distributed(4, ['Story Drifts'])['Story Drifts']
+        """
+        # Imported here since the farm depends on the model classes
+        from pyCSI.farm import AnalysisFarm  # pylint: disable=import-outside-toplevel
+
+        cases = [case for case, run in self.get_run_flags(use_cache=False).items() if run]
+        if not cases:
+            raise ValueError('There are no load cases set to run')
+
+        costs = {**self._case_costs, **(case_costs or {})}
+        workers_cases = self._split_cases(cases, costs, n_workers)
+
+        # Normalize table requests
+        requests = []
+        for request in tables:
+            if isinstance(request, str):
+                request = TableRequest(request)
+            elif not isinstance(request, TableRequest):
+                request = TableRequest(*request)
+            requests.append(request._replace(name=request.name or request.table_key, load_combos=[]))
+
+        # Copy the model to the working folders
+        self._parent.file.save()
+        model_file = Path(self._parent.get_file_name(include_path=True))
+        root = Path(tempfile.mkdtemp(prefix='pyCSI-', dir=working_directory))
+        try:
+            model_copies = []
+            for worker in range(len(workers_cases)):
+                folder = root / f'worker_{worker}'
+                folder.mkdir(parents=True, exist_ok=True)
+                model_copies.append(shutil.copy2(model_file, folder / model_file.name))
+
+            # Run the copies
+            farm_options.setdefault('model_class', type(self._parent))
+            farm_options.setdefault('version', self._parent.software_version)
+            with AnalysisFarm(len(workers_cases), **farm_options) as farm:
+                jobs = {}
+                for model_copy, worker_cases in zip(model_copies, workers_cases):
+                    worker_requests = [request._replace(load_cases=worker_cases) for request in requests]
+                    job_id = farm.submit(model_copy, worker_requests, save=keep_files, timeout=timeout,
+                                         cases=worker_cases)
+                    jobs[job_id] = worker_cases
+                results = list(farm.results())
+        finally:
+            if not keep_files:
+                shutil.rmtree(root, ignore_errors=True)
+
+        errors = [f'{result.model_file}: {result.error}' for result in results if result.error]
+        if errors:
+            raise APIBadRequest('APIBadRequest: Distributed analysis failed\n' + '\n'.join(errors),
+                                ReturnCode.UNSPECIFIED_ERROR)
+
+        # Update the estimated cost of each case from the run time of its copy
+        for result in results:
+            worker_cases = jobs[result.job_id]
+            total_cost = sum(costs.get(case, 1.0) for case in worker_cases)
+            for case in worker_cases:
+                self._case_costs[case] = result.elapsed * costs.get(case, 1.0) / total_cost
+
+        # Concatenate the tables of the copies and restore the row order of a single run
+        results.sort(key=lambda result: cases.index(jobs[result.job_id][0]))
+        case_order = {case: index for index, case in enumerate(cases)}
+        tables_data = {}
+        for request in requests:
+            frames = [result.tables[request.name] for result in results]
+            table = pd.concat(frames, ignore_index=True)
+
+            # Categorical columns of the copies have different categories, keep them categorical as in a single run
+            for column in table.columns:
+                if all(isinstance(frame[column].dtype, pd.CategoricalDtype) for frame in frames):
+                    table[column] = union_categoricals([frame[column] for frame in frames])
+
+            if 'OutputCase' in table.columns:
+                # Rows are grouped by the fields preceding the load case, ranked by their first appearance since every
+                # copy lists the objects in the same order, and sorted by load case within each group
+                key_fields = list(table.columns[:table.columns.get_loc('OutputCase')])
+                order = pd.DataFrame({
+                    'key': (table.groupby(key_fields, sort=False, dropna=False, observed=True).ngroup()
+                            if key_fields else 0),
+                    'case': table['OutputCase'].astype(object).map(case_order).fillna(len(cases))})
+                table = table.iloc[order.sort_values(['key', 'case'], kind='stable').index].reset_index(drop=True)
+            tables_data[request.name] = table
+
+        return tables_data
+
+    def recommend_solver_options(self, cores: Optional[int] = None, cases: Optional[int] = None,
+                                 apply: bool = False) -> SolverOptions:
+        """Recommends solver options from the number of processor cores and
+        the number of cases to run.
+
+        Cases are run in parallel in a separate process, up to 8 runs and
+        leaving at least two threads to each run. The available threads are
+        split between the parallel runs and the multi-threaded solver is used
+        when more than one thread is available. The response file size and
+        stiffness case of the current options are kept.
 
-    def set_load_cases_to_run(self, run: bool, load_cases: Optional[list[str]] = None):
+        Args:
+            cores: Number of logical processor cores. Defaults to None (cores
+            of this machine).
+            cases: Number of cases to run. Defaults to None (cases currently
+            set to run).
+            apply: If `True`, the recommended options are set to the model.
+            Defaults to `False`.
+
+        Returns:
+            The recommended `SolverOptions`.
+        """
+        cores = max(cores or os.cpu_count() or 1, 1)
+        cases = sum(self.get_run_flags().values()) if cases is None else cases
+
+        parallel_runs = max(min(8, cases, cores // 2), 1)
+        analysis_threads = max(cores // parallel_runs, 1)
+        current_options = self.solver_options
+        options = current_options._replace(
+            solver_type=SolverType.MULTI_THREADED if analysis_threads > 1 else SolverType.ADVANCED,
+            process_type=SolverProcessType.SEPARATE_PROCESS if parallel_runs > 1 else SolverProcessType.AUTO,
+            parallel_runs=parallel_runs,
+            analysis_threads=analysis_threads)
+
+        if apply:
+            self.solver_options = options
+        return options
+
+    def get_run_flags(self, use_cache: bool = True) -> dict[str, bool]:
+        """Gets the run flag of every analysis case.
+
+        Args:
+            use_cache: If `False`, the flags are requested to the CSI API even
+            if they are cached. Flags are cached until they are set through
+            this component. Defaults to `True`.
+
+        Returns:
+            A dictionary mapping each analysis case to `True` if it is set to
+            be run.
+        """
+        if self._run_flags is None or not use_cache:
+            request_result = self._analyze.GetRunCaseFlag()
+            check_request(request_result[-1])  # Check API request
+            self._run_flags = {case: bool(run) for case, run in zip(request_result[1], request_result[2])}
+
+        return dict(self._run_flags)
+
+    def set_run_flags(self, run_flags: dict[str, bool]) -> int:
+        """Sets the run flag of the specified analysis cases, making as few
+        requests as possible.
+
+        Current flags are read from the CSI API, so cases added or flags
+        changed outside this component are taken into account. Only the cases
+        which flag changes are set. If it takes fewer requests, the flag of
+        all cases is set at once first and the remaining cases are toggled
+        afterwards.
+
+        Args:
+            run_flags: Dictionary mapping analysis cases to `True` if they are
+            to be run. Cases not included keep their current flag.
+
+        Returns:
+            The number of requests made to the CSI API to set the flags.
+        """
+        return self._set_run_flags(run_flags, self.get_run_flags(use_cache=False))
+
+    def _set_run_flags(self, run_flags: dict[str, bool], current_flags: dict[str, bool]) -> int:
+        unknown_cases = sorted(set(run_flags) - set(current_flags))
+        if unknown_cases:
+            raise ValueError(f'Load cases {unknown_cases} are not defined in the model')
+
+        target_flags = {**current_flags, **{case: bool(run) for case, run in run_flags.items()}}
+
+        # Requests needed toggling each changed case, or setting all cases first
+        options = [(None, [case for case, run in target_flags.items() if run != current_flags[case]])]
+        for run_all in (True, False):
+            options.append((run_all, [case for case, run in target_flags.items() if run != run_all]))
+        run_all, cases = min(options, key=lambda option: len(option[1]) + (option[0] is not None))
+
+        if run_all is not None:
+            return_code = self._analyze.SetRunCaseFlag('', run_all, True)
+            check_request(return_code)
+        for case in cases:
+            return_code = self._analyze.SetRunCaseFlag(case, target_flags[case])
+            check_request(return_code)
+
+        self._run_flags = target_flags
+        return len(cases) + (run_all is not None)
+
+    def set_load_cases_to_run(self, run: bool, load_cases: Optional[list[str]] = None, exclusive: bool = False):
         """Set the specified load cases to be run.
 
+        Current flags are read once and only the cases which flag changes are
+        set, see `set_run_flags()`.
+
         Args:
             run: If `True`, set the specified load cases to be Run, otherwise set 
             to Not Run.
@@ -41,33 +487,180 @@ class Analysis:
             load_cases: List of load cases to be set. If not provided run flag 
             will be set for all load cases defined in the model. Defaults to
             None.
+
+            exclusive: If `True`, all other load cases are set to the opposite
+            flag, e.g. "run only these cases" or "run all cases except these".
+            Defaults to `False`.
         """
-        # Set run flag for all available load cases
+        current_flags = self.get_run_flags(use_cache=False)
         if load_cases is None:
-            return_code = self._analyze.SetRunCaseFlag('', run, True)
-            check_request(return_code)
-            return
+            run_flags = dict.fromkeys(current_flags, run)
+        elif exclusive:
+            run_flags = dict.fromkeys(current_flags, not run)
+            run_flags.update(dict.fromkeys(load_cases, run))
+        else:
+            run_flags = dict.fromkeys(load_cases, run)
 
-        # Set run flag for specific load cases
-        for case in load_cases:
-            return_code = self._analyze.SetRunCaseFlag(case, run)
-            check_request(return_code)
+        self._set_run_flags(run_flags, current_flags)
+
+    def get_case_status(self) -> dict[str, CaseStatus]:
+        """Gets the analysis status of every analysis case.
+
+        Returns:
+            A dictionary mapping each analysis case to its `CaseStatus`.
+        """
+        request_result = self._analyze.GetCaseStatus()
+        check_request(request_result[-1])  # Check API request
+        return {case: CaseStatus(status) for case, status in zip(request_result[1], request_result[2])}
 
     def delete_results(self, load_cases: Optional[list[str]] = None):
         """Deletes the results for the specified load cases.
 
+        The case status is read once and only cases with results are deleted.
+        If all cases with results are to be deleted, a single request is
+        made.
+
         Args:
             load_cases: List of load cases which results will be deleted. 
             If not provided, results will be deleted for all load cases
             defined in the model. Defaults to None.
         """
-        # Delete results for all available load cases
+        case_status = self.get_case_status()
+        cases_with_results = {case for case, status in case_status.items() if status != CaseStatus.NOT_RUN}
         if load_cases is None:
+            cases = cases_with_results
+        else:
+            unknown_cases = sorted(set(load_cases) - set(case_status))
+            if unknown_cases:
+                raise ValueError(f'Load cases {unknown_cases} are not defined in the model')
+            cases = cases_with_results.intersection(load_cases)
+
+        if not cases:
+            return
+
+        # Delete results for all available load cases
+        if cases == cases_with_results:
             return_code = self._analyze.DeleteResults('', all=True)
             check_request(return_code)
-            return
 
         # Delete results for specific load cases
-        for case in load_cases:
-            return_code = self._analyze.DeleteResults(case)
-            check_request(return_code)
+        else:
+            for case in sorted(cases):
+                return_code = self._analyze.DeleteResults(case)
+                check_request(return_code)
+
+        self._parent.tables.clear_views()
+
+    ###################################################################################################################
+    # Miscellaneous Methods
+    ###################################################################################################################
+
+    def _get_fingerprint(self, method: Literal['tables', 'file'], run_flags: dict[str, bool]) -> str:
+        # Gets the fingerprint of the model definition and the given run flags, see `get_fingerprint()`
+
+        if method not in ('tables', 'file'):
+            raise ValueError(f'Fingerprint method {method} is not valid. Valid methods are tables and file')
+
+        fingerprint = hashlib.sha256()
+        fingerprint.update(json.dumps(run_flags, sort_keys=True).encode('utf-8'))
+
+        if method == 'file':
+            with open(self._parent.get_file_name(include_path=True), 'rb') as file:
+                while chunk := file.read(1 << 20):
+                    fingerprint.update(chunk)
+            return fingerprint.hexdigest()
+
+        # Model definition tables are the ones that can be imported
+        database_tables = self._parent.get_model_object().DatabaseTables
+        for table in sorted(self._parent.tables.catalog.get_tables().values()):
+            if table.import_type < 1 or table.is_empty:
+                continue
+
+            request_result = database_tables.GetTableForDisplayArray(table.key, [''], 'All')
+            check_request(request_result[-1])  # Check API request
+            fingerprint.update(table.key.encode('utf-8'))
+            fingerprint.update('\x1f'.join(map(str, request_result[2])).encode('utf-8'))
+            fingerprint.update('\x1f'.join(map(str, request_result[4])).encode('utf-8'))
+
+        return fingerprint.hexdigest()
+
+    def _record_run(self, fingerprint_method: Literal['tables', 'file'], track: bool) -> None:
+        # Records the fingerprint and run cases of a finished analysis if freshness is tracked, otherwise the
+        # previous record is outdated
+
+        if not track and self._fingerprint_file is None:
+            self._last_run = None
+            return
+
+        run_flags = self.get_run_flags(use_cache=False)
+        self._last_run = {'fingerprint': self._get_fingerprint(fingerprint_method, run_flags),
+                          'method': fingerprint_method,
+                          'cases': [case for case, run in run_flags.items() if run],
+                          'time': time.time()}
+
+        if self._fingerprint_file is None:
+            return
+
+        stored_runs = {}
+        if self._fingerprint_file.is_file():
+            with open(self._fingerprint_file, encoding='utf-8') as file:
+                stored_runs = json.load(file)
+        stored_runs[self._parent.get_file_name(include_path=True)] = self._last_run
+
+        temporary_file = self._fingerprint_file.with_suffix(self._fingerprint_file.suffix + '.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(stored_runs, file)
+        os.replace(temporary_file, self._fingerprint_file)
+
+    @staticmethod
+    def _split_cases(cases: list[str], costs: dict[str, float], n_workers: int) -> list[list[str]]:
+        # Splits the cases among workers, assigning the costliest cases first to the least loaded worker
+
+        loads = [(0.0, worker) for worker in range(min(n_workers, len(cases)))]
+        workers_cases: list[list[str]] = [[] for _ in loads]
+        for case in sorted(cases, key=lambda case: -costs.get(case, 1.0)):
+            load, worker = heapq.heappop(loads)
+            workers_cases[worker].append(case)
+            heapq.heappush(loads, (load + costs.get(case, 1.0), worker))
+
+        # Keep the model order of the cases of each worker
+        return [sorted(worker_cases, key=cases.index) for worker_cases in workers_cases]
+
+    def _run_analysis_in_thread(self, stream: ctypes.c_void_p, analyze_type: type) -> int:
+        # Runs the analysis from a background thread, which joins the COM multithreaded apartment and unmarshals
+        # the analysis interface of the caller thread
+
+        comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        try:
+            analyze = _unmarshal_interface(stream, analyze_type)
+            try:
+                return analyze.RunAnalysis()
+            finally:
+                del analyze
+        finally:
+            comtypes.CoUninitialize()
+
+    def _terminate_instance(self, pid: int) -> None:
+        # Cancels a running analysis by terminating the instance of the software, the CSI API cannot stop it
+
+        os.kill(pid, signal.SIGTERM)
+        self._parent._set_model_object(None)
+        self._parent._api_object = None
+        self._parent.pid = None
+
+
+def _marshal_interface(interface) -> ctypes.c_void_p:
+    # Marshals a COM interface into a stream, to be unmarshaled once by another thread
+
+    stream = ctypes.c_void_p()
+    ctypes.oledll.ole32.CoMarshalInterThreadInterfaceInStream(ctypes.byref(interface._iid_), interface,
+                                                              ctypes.byref(stream))
+    return stream
+
+
+def _unmarshal_interface(stream: ctypes.c_void_p, interface_type: type):
+    # Unmarshals a COM interface marshaled by `_marshal_interface()` and releases the stream
+
+    interface = interface_type()
+    ctypes.oledll.ole32.CoGetInterfaceAndReleaseStream(stream, ctypes.byref(interface._iid_), ctypes.byref(interface))
+    return interface
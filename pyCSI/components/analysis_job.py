@@ -0,0 +1,244 @@
+"""
+=====
+PyCSI Analysis Job
+=====
+
+Handle of an analysis running in a background thread, with progress estimated from the analysis log file.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import CancelledError
+from pathlib import Path
+from typing import Callable
+from typing import Optional
+
+from pyCSI.utils import check_request
+
+
+class AnalysisJob:
+    """Future-like handle of an analysis run, see `Analysis.start()`.
+
+    The analysis request runs in a background thread, so the caller can
+    poll `done()`, wait with `result(timeout)` or do other work while the
+    model is solved. Progress is estimated from the analysis log file
+    written next to the model.
+
+    Note:
+        A timeout only stops waiting for the analysis, use `cancel()` to stop
+        it.
+
+    Args:
+        runner: Function that runs the analysis and returns the CSI API
+        return code.
+        log_file: Path of the analysis log file. Defaults to None (no
+        progress estimate).
+        cases_to_run: Number of load cases set to run, used to estimate the
+        progress. Defaults to None.
+        on_finish: Function called once, from the caller thread, when the
+        analysis finishes successfully. Defaults to None.
+        canceller: Function that stops the running analysis, see `cancel()`.
+        Defaults to None (the job cannot be cancelled).
+    """
+
+    CASE_PATTERN = re.compile(r'^\s*CASE:\s*(\S+)', re.MULTILINE)
+    COMPLETE_PATTERN = re.compile(r'A\s*N\s*A\s*L\s*Y\s*S\s*I\s*S\s+C\s*O\s*M\s*P\s*L\s*E\s*T\s*E')
+
+    def __init__(self, runner: Callable[[], int], log_file: Optional[Path | str] = None,
+                 cases_to_run: Optional[int] = None, on_finish: Optional[Callable[[], None]] = None,
+                 canceller: Optional[Callable[[], None]] = None) -> None:
+        self.log_file = None if log_file is None else Path(log_file)
+        self.cases_to_run = cases_to_run
+        self.start_time = time.time()
+        self.end_time: float | None = None
+        self._runner = runner
+        self._on_finish = on_finish
+        self._canceller = canceller
+        self._cancelled = False
+        self._return_code: int | None = None
+        self._exception: BaseException | None = None
+        self._finalized = False
+        self._log_offset = 0
+        self._log_cases: set[str] = set()
+        self._log_complete = False
+        self._last_log_line = ''
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='pyCSI-analysis', daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        state = 'cancelled' if self._cancelled else 'finished' if self.done() else 'running'
+        return f'AnalysisJob({state}, elapsed={self.elapsed:.1f}s, progress={self.progress:.0%})'
+
+###################################################################################################################
+# Class properties
+###################################################################################################################
+
+    @property
+    def elapsed(self) -> float:
+        """Gets the elapsed time of the analysis in seconds"""
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def progress(self) -> float:
+        """Gets the estimated progress of the analysis, between 0 and 1.
+
+        The progress is the share of load cases found in the analysis log
+        file, and is only 1 once the analysis is finished.
+        """
+        if self._finished.is_set() and self._exception is None:
+            return 1.0
+
+        self._read_log()
+        if self._log_complete:
+            return 0.99
+        if not self.cases_to_run:
+            return 0.0
+        return min(len(self._log_cases) / self.cases_to_run, 0.99)
+
+    @property
+    def status(self) -> str:
+        """Gets the last line written to the analysis log file"""
+
+        self._read_log()
+        return self._last_log_line
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def done(self) -> bool:
+        """Returns `True` if the analysis has finished, successfully or not"""
+
+        if self._finished.is_set():
+            self._finalize()
+            return True
+        return False
+
+    def running(self) -> bool:
+        """Returns `True` if the analysis is still running"""
+        return not self.done()
+
+    def cancelled(self) -> bool:
+        """Returns `True` if the analysis was cancelled"""
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        """Stops the analysis if it is still running.
+
+        The CSI API cannot stop a running analysis, the canceller provided by
+        `Analysis.start()` terminates the instance of the software.
+
+        Returns:
+            `True` if the analysis was cancelled, `False` if it had already
+            finished or the job was created without a canceller.
+        """
+        if self._finished.is_set() or self._canceller is None:
+            return False
+
+        self._canceller()
+        self._cancelled = True
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the analysis to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds. Defaults to None (no
+            limit).
+
+        Returns:
+            `True` if the analysis finished, `False` if the timeout expired.
+        """
+        return self._finished.wait(timeout) and self.done()
+
+    def result(self, timeout: Optional[float] = None) -> None:
+        """Waits for the analysis to finish and checks its result.
+
+        Args:
+            timeout: Maximum time to wait in seconds. Defaults to None (no
+            limit).
+
+        Raises:
+            TimeoutError: If the analysis did not finish within the timeout.
+            CancelledError: If the analysis was cancelled.
+            APIBadRequest: If the analysis request failed.
+        """
+        if self._cancelled:
+            raise CancelledError('Analysis was cancelled')
+
+        if not self.wait(timeout):
+            raise TimeoutError(f'Analysis did not finish within {timeout} seconds')
+
+        if self._exception is not None:
+            raise self._exception
+
+    def exception(self, timeout: Optional[float] = None) -> BaseException | None:
+        """Waits for the analysis to finish and returns the exception raised
+        by the analysis request, if any. See `result()`."""
+
+        try:
+            self.result(timeout)
+        except (TimeoutError, CancelledError):
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            return error
+        return None
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _run(self) -> None:
+        # Runs the analysis request in the background thread
+
+        try:
+            self._return_code = self._runner()
+            check_request(self._return_code)
+        except BaseException as error:  # pylint: disable=broad-except
+            self._exception = error
+        finally:
+            self.end_time = time.time()
+            self._finished.set()
+
+    def _finalize(self) -> None:
+        # Calls the finish function once, from the caller thread
+
+        if self._finalized:
+            return
+
+        self._finalized = True
+        if self._exception is None and not self._cancelled and self._on_finish is not None:
+            self._on_finish()
+
+    def _read_log(self) -> None:
+        # Reads the lines appended to the analysis log file since the last read
+
+        if self.log_file is None or not self.log_file.is_file():
+            return
+
+        # Skip log files of previous runs
+        file_stat = self.log_file.stat()
+        if file_stat.st_mtime < self.start_time - 1:
+            return
+
+        # The log file is written again from the start on each run
+        if file_stat.st_size < self._log_offset:
+            self._log_offset = 0
+            self._log_cases.clear()
+
+        with open(self.log_file, 'rb') as file:
+            file.seek(self._log_offset)
+            data = file.read()
+
+        # Only complete lines are read, the last line may still be written
+        data = data[:data.rfind(b'\n') + 1]
+        self._log_offset += len(data)
+        text = data.decode('utf-8', errors='replace')
+
+        self._log_cases.update(self.CASE_PATTERN.findall(text))
+        self._log_complete = self._log_complete or bool(self.COMPLETE_PATTERN.search(text))
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if lines:
+            self._last_log_line = lines[-1]
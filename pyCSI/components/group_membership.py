@@ -0,0 +1,167 @@
+"""
+=====
+PyCSI Group Membership
+=====
+
+Snapshots of the objects assigned to a group, with local set operations between them.
+"""
+
+from typing import Iterable
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from pyCSI.enums import ObjectType
+
+
+class GroupMembership:
+    """Immutable snapshot of the objects assigned to a group.
+
+    Objects are stored as an array of object type codes (see `ObjectType`)
+    and an array of unique names. Union, intersection and difference are
+    computed locally, so derived groups can be built without round trips to
+    the CSI API and only the result is assigned to the model.
+
+    Args:
+        object_types: Object type code of each object.
+        names: Unique name of each object.
+        group_name: Name of the group the snapshot was taken from. Defaults
+        to None.
+
+    Example:
+        .. codeblock:: python
+
+            walls = model.groups.get_assignments('Core Walls')
+            level_1 = model.groups.get_assignments('Level 1')
+            upper_walls = walls - level_1
+            model.groups.assign_objects(upper_walls.to_dataframe(), 'Upper Core Walls', replace_group=True)
+    """
+
+    TYPE_NAMES = {ObjectType.POINT: 'joint', ObjectType.FRAME: 'frame', ObjectType.CABLE: 'cable',
+                  ObjectType.TENDON: 'tendon', ObjectType.AREA: 'area', ObjectType.SOLID: 'solid',
+                  ObjectType.LINK: 'link'}
+
+    def __init__(self, object_types: Iterable[int], names: Iterable[str], group_name: str | None = None) -> None:
+        object_types = np.array(object_types, dtype=np.int8)
+        names = np.array(names, dtype=object)
+        if object_types.shape != names.shape:
+            raise ValueError('Object types and names must have the same length')
+
+        # Remove duplicated objects keeping the first occurrence
+        keys = self._get_keys(object_types, pd.factorize(names)[0])
+        if len(pd.unique(keys)) != len(keys):
+            unique = ~pd.Series(keys).duplicated().to_numpy()
+            object_types, names = object_types[unique], names[unique]
+
+        object_types.flags.writeable = False
+        names.flags.writeable = False
+        self.object_types = object_types
+        self.names = names
+        self.group_name = group_name
+
+    @classmethod
+    def from_dataframe(cls, objects: pd.DataFrame, group_name: str | None = None) -> 'GroupMembership':
+        """Creates a snapshot from a two column DataFrame containing the
+        object's unique name and type, see `Groups.add_object_from_name()`
+        for valid object types"""
+
+        type_codes = {type_name: int(code) for code, type_name in cls.TYPE_NAMES.items()}
+        object_types = objects.iloc[:, 1].astype(str).str.strip().str.lower().map(type_codes)
+        if object_types.isna().any():
+            invalid_types = sorted(set(objects.iloc[:, 1][object_types.isna()].astype(str)))
+            raise ValueError(f'Object types {invalid_types} are not valid')
+
+        return cls(object_types.to_numpy(), objects.iloc[:, 0].astype(str).to_numpy(), group_name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return zip(self.object_types.tolist(), self.names.tolist())
+
+    def __contains__(self, item: tuple[int, str]) -> bool:
+        object_type, name = item
+        return bool(np.any((self.object_types == int(object_type)) & (self.names == name)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GroupMembership):
+            return NotImplemented
+        return len(self) == len(other) and len(self.difference(other)) == 0
+
+    def __repr__(self) -> str:
+        return f'GroupMembership({self.group_name!r}, objects={len(self)})'
+
+    def __or__(self, other: 'GroupMembership') -> 'GroupMembership':
+        return self.union(other)
+
+    def __and__(self, other: 'GroupMembership') -> 'GroupMembership':
+        return self.intersection(other)
+
+    def __sub__(self, other: 'GroupMembership') -> 'GroupMembership':
+        return self.difference(other)
+
+    def __xor__(self, other: 'GroupMembership') -> 'GroupMembership':
+        return self.symmetric_difference(other)
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def union(self, other: 'GroupMembership') -> 'GroupMembership':
+        """Returns the objects assigned to either snapshot"""
+
+        keys, other_keys = self._get_shared_keys(other)
+        other_only = ~np.isin(other_keys, keys)
+        return GroupMembership(np.concatenate([self.object_types, other.object_types[other_only]]),
+                               np.concatenate([self.names, other.names[other_only]]))
+
+    def intersection(self, other: 'GroupMembership') -> 'GroupMembership':
+        """Returns the objects assigned to both snapshots"""
+        keys, other_keys = self._get_shared_keys(other)
+        return self._take(np.isin(keys, other_keys))
+
+    def difference(self, other: 'GroupMembership') -> 'GroupMembership':
+        """Returns the objects of this snapshot not assigned to the other"""
+        keys, other_keys = self._get_shared_keys(other)
+        return self._take(~np.isin(keys, other_keys))
+
+    def symmetric_difference(self, other: 'GroupMembership') -> 'GroupMembership':
+        """Returns the objects assigned to only one of the snapshots"""
+        return self.difference(other).union(other.difference(self))
+
+    def of_type(self, *object_types: ObjectType | int | str) -> 'GroupMembership':
+        """Returns the objects of the specified types. Types can be provided
+        as `ObjectType` codes or names, e.g. 'frame' or 'area'."""
+
+        type_codes = {type_name: int(code) for code, type_name in self.TYPE_NAMES.items()}
+        codes = [type_codes[object_type.lower()] if isinstance(object_type, str) else int(object_type)
+                 for object_type in object_types]
+        return self._take(np.isin(self.object_types, codes))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Gets the objects in DataFrame format, with the unique name and type
+        columns accepted by `Groups.assign_objects()`"""
+
+        type_names = pd.Series(self.object_types).map({int(code): name for code, name in self.TYPE_NAMES.items()})
+        return pd.DataFrame({'name': self.names, 'type': type_names.to_numpy()})
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    @staticmethod
+    def _get_keys(object_types: np.ndarray, name_codes: np.ndarray) -> np.ndarray:
+        # Combines object type codes and factorized names into a single integer key per object
+        return name_codes.astype(np.int64) * 8 + object_types
+
+    def _get_shared_keys(self, other: 'GroupMembership') -> tuple[np.ndarray, np.ndarray]:
+        # Gets the integer keys of both snapshots, with names factorized together so keys are comparable
+
+        name_codes = pd.factorize(np.concatenate([self.names, other.names]))[0]
+        return (self._get_keys(self.object_types, name_codes[:len(self)]),
+                self._get_keys(other.object_types, name_codes[len(self):]))
+
+    def _take(self, mask: np.ndarray) -> 'GroupMembership':
+        # Returns a new snapshot with the objects selected by the boolean mask
+        return GroupMembership(self.object_types[mask], self.names[mask])
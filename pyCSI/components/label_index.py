@@ -0,0 +1,119 @@
+"""
+=====
+PyCSI Label Index
+=====
+
+Index of the object labels of the model, used to resolve (label, story) pairs into unique names.
+"""
+
+import pandas as pd
+
+
+class LabelIndex:
+    """Index of (label, story) pairs to the unique name and type of the
+    model objects.
+
+    The index is built once from the object assignment tables of the model
+    and resolves whole DataFrames with a single merge. It is rebuilt when the
+    model state changes (see `TableCatalog.state_key`) or after geometry or
+    connectivity tables are edited (see `Tables.geometry_revision`).
+
+    Args:
+        tables (Tables): Tables component of the model.
+    """
+
+    SOURCE_TABLES = {'frame': ('Frame Assignments - Summary',),
+                     'area': ('Area Assignments - Summary',),
+                     'joint': ('Point Object Connectivity', 'Joint Assignments - Summary'),
+                     'link': ('Link Assignments - Summary',)}
+    FIELDS = ['Story', 'Label', 'UniqueName']
+
+    def __init__(self, tables) -> None:
+        self._tables = tables
+        self._index: pd.DataFrame | None = None
+        self._state: tuple[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.get_index())
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def get_index(self) -> pd.DataFrame:
+        """Gets the index in DataFrame format, building it if needed.
+
+        Returns:
+            A DataFrame with the label, story, name and type of each object.
+        """
+        state = (self._tables.catalog.state_key, self._tables.geometry_revision)
+        if self._index is None or self._state != state:
+            self._index = self._build()
+            self._state = state
+
+        return self._index
+
+    def resolve(self, objects: pd.DataFrame) -> pd.DataFrame:
+        """Gets the unique name and type of the specified objects.
+
+        Args:
+            objects: A two column Dataframe containing the object\'s label and
+            story.
+
+        Returns:
+            A DataFrame with the name and type of each object, in the same
+            order as the provided objects.
+
+        Raises:
+            ValueError: If any of the objects is not found in the model.
+        """
+        labels = pd.DataFrame({'label': objects.iloc[:, 0].astype(str).str.strip().str.upper().to_numpy(),
+                               'story': objects.iloc[:, 1].astype(str).str.strip().to_numpy()})
+        resolved = labels.merge(self.get_index(), on=['label', 'story'], how='left')
+
+        missing = resolved['name'].isna()
+        if missing.any():
+            missing_objects = list(zip(resolved.loc[missing, 'label'], resolved.loc[missing, 'story']))
+            raise ValueError(f'Objects {missing_objects} were not found in the model')
+
+        return resolved[['name', 'type']]
+
+    def lookup(self, label: str, story: str) -> tuple[str, str]:
+        """Gets the unique name and type of a single object"""
+
+        resolved = self.resolve(pd.DataFrame({'label': [label], 'story': [story]}))
+        return resolved['name'].iloc[0], resolved['type'].iloc[0]
+
+    def invalidate(self) -> None:
+        """Clears the index, it will be built again on next use"""
+        self._index = None
+        self._state = None
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _build(self) -> pd.DataFrame:
+        # Builds the index from the object assignment tables
+
+        catalog = self._tables.catalog
+        available_tables = catalog.get_tables()
+        frames = []
+        for object_type, table_keys in self.SOURCE_TABLES.items():
+            table_key = next((key for key in table_keys if key in available_tables
+                              and set(self.FIELDS).issubset(catalog.get_fields(key).keys)), None)
+            if table_key is None:
+                continue
+
+            table_data = self._tables.get_table_dataframe(table_key, use_cache=False, columns=self.FIELDS,
+                                                          categorical=False)
+            frames.append(pd.DataFrame({'label': table_data['Label'].astype(str).str.upper().to_numpy(),
+                                        'story': table_data['Story'].astype(str).to_numpy(),
+                                        'name': table_data['UniqueName'].astype(str).to_numpy(),
+                                        'type': object_type}))
+
+        if not frames:
+            return pd.DataFrame(columns=['label', 'story', 'name', 'type'], dtype=object)
+
+        # Keep the first object type found for duplicated (label, story) pairs
+        return pd.concat(frames, ignore_index=True).drop_duplicates(['label', 'story'])
@@ -0,0 +1,254 @@
+"""
+=====
+PyCSI Table Results Cache
+=====
+
+Persistent cache of database tables stored as Parquet or Feather files, keyed by the fingerprint of the model file.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Literal
+from typing import Optional
+
+import pandas as pd
+
+
+class TableResultsCache:
+    """On-disk cache of database tables.
+
+    Each entry is keyed by the model file fingerprint (path, size,
+    modification time and content hash), the table key, the group and the
+    load selection used to request it. Least recently used entries are
+    evicted once the cache exceeds its maximum size.
+
+    Note:
+        The fingerprint is computed from the model file on disk. `Tables`
+        only uses the cache for saved, locked models and adds the number of
+        table edits applied in the session (`Tables.revision`) to the key.
+
+    Args:
+        directory: Folder where the cached tables are stored.
+        max_size_mb: Maximum size of the cache in megabytes. Defaults to 1024.
+        file_format: File format of the cached tables, 'parquet' or
+        'feather'. Both formats require the `pyarrow` package. Defaults to
+        'parquet'.
+    """
+
+    INDEX_FILE = 'index.json'
+    HASH_CHUNK_SIZE = 1 << 20
+
+    def __init__(self, directory: Path | str, max_size_mb: float = 1024,
+                 file_format: Literal['parquet', 'feather'] = 'parquet') -> None:
+        if file_format not in ('parquet', 'feather'):
+            raise ValueError(f'File format {file_format} is not valid. Valid formats are parquet and feather')
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = int(max_size_mb * 1024 ** 2)
+        self.file_format = file_format
+        self.hits = 0
+        self.misses = 0
+        self._index: dict[str, dict] = self._load_index()
+        self._hashes: dict[tuple[str, int, int], str] = {}
+
+###################################################################################################################
+# Class properties
+###################################################################################################################
+
+    @property
+    def size(self) -> int:
+        """Gets the total size of the cached tables in bytes"""
+        return sum(entry['size'] for entry in self._index.values())
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Gets the cache statistics.
+
+        Returns:
+            A dictionary containing the number of hits, misses, hit rate,
+            cached entries and cache size in bytes.
+        """
+        requests = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'entries': len(self._index),
+                'size': self.size}
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def get_fingerprint(self, model_file: Path | str) -> tuple[str, int, int, str]:
+        """Gets the fingerprint of a model file.
+
+        The content hash is only computed again when the size or the
+        modification time of the file change.
+
+        Returns:
+            A tuple containing the resolved path, size, modification time in
+            nanoseconds and SHA-256 hash of the model file.
+        """
+        path = str(Path(model_file).resolve())
+        file_stat = os.stat(path)
+        stat_key = (path, file_stat.st_size, file_stat.st_mtime_ns)
+
+        if stat_key not in self._hashes:
+            file_hash = hashlib.sha256()
+            with open(path, 'rb') as file:
+                while chunk := file.read(self.HASH_CHUNK_SIZE):
+                    file_hash.update(chunk)
+            self._hashes[stat_key] = file_hash.hexdigest()
+
+        return (*stat_key, self._hashes[stat_key])
+
+    def get_key(self, model_file: Path | str, table_key: str, group: Optional[str] = None,
+                load_cases: Optional[list[str]] = None, load_combos: Optional[list[str]] = None,
+                load_patterns: Optional[list[str]] = None, **kwargs) -> str:
+        """Gets the cache key of a table request.
+
+        Args:
+            model_file: Path of the model file.
+            table_key: The name of the requested table.
+            group: The name of the requested group. Defaults to None.
+            load_cases: Load cases selected for display. Defaults to None.
+            load_combos: Load combinations selected for display. Defaults
+            to None.
+            load_patterns: Load patterns selected for display. Defaults to
+            None.
+
+        Keyword Args:
+            **kwargs: Any additional option that changes the returned table.
+
+        Returns:
+            The cache key in string format.
+        """
+        request = {'model': self.get_fingerprint(model_file),
+                   'table_key': table_key,
+                   'group': group or 'All',
+                   'load_cases': sorted(load_cases or []),
+                   'load_combos': sorted(load_combos or []),
+                   'load_patterns': sorted(load_patterns or []),
+                   'options': kwargs}
+        request_string = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(request_string.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Gets a cached table.
+
+        Returns:
+            Table data in `DataFrame` format if the key is cached, otherwise
+            None.
+        """
+        entry = self._index.get(key)
+        if entry is None or not (self.directory / entry['file']).is_file():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry['last_access'] = time.time()
+        self._save_index()
+
+        file = self.directory / entry['file']
+        if self.file_format == 'feather':
+            table_data = pd.read_feather(file)
+        else:
+            table_data = pd.read_parquet(file)
+
+        # Restore categorical columns not preserved by the file format
+        for column in entry.get('categorical', []):
+            if not isinstance(table_data[column].dtype, pd.CategoricalDtype):
+                table_data[column] = table_data[column].astype('category')
+        return table_data
+
+    def put(self, key: str, table_data: pd.DataFrame, table_key: str, model_file: Path | str) -> None:
+        """Stores a table in the cache and evicts the least recently used
+        entries if the cache exceeds its maximum size.
+
+        Args:
+            key: Cache key of the table, see `get_key()`.
+            table_data: Table data in `DataFrame` format.
+            table_key: The name of the table.
+            model_file: Path of the model file.
+        """
+        file_name = f'{key}.{self.file_format}'
+        file = self.directory / file_name
+        if self.file_format == 'feather':
+            table_data.reset_index(drop=True).to_feather(file)
+        else:
+            table_data.to_parquet(file, index=False)
+
+        self._index[key] = {'file': file_name,
+                            'size': file.stat().st_size,
+                            'last_access': time.time(),
+                            'table_key': table_key,
+                            'model_file': str(Path(model_file).resolve()),
+                            'categorical': [str(column) for column, dtype in table_data.dtypes.items()
+                                            if isinstance(dtype, pd.CategoricalDtype)]}
+        self._evict()
+        self._save_index()
+
+    def invalidate(self, table_key: Optional[str] = None, model_file: Optional[Path | str] = None) -> int:
+        """Removes entries from the cache. If no arguments are provided the
+        whole cache is cleared.
+
+        Args:
+            table_key: If provided, only entries of this table are removed.
+            Defaults to None.
+            model_file: If provided, only entries of this model file are
+            removed. Defaults to None.
+
+        Returns:
+            The number of removed entries.
+        """
+        model_path = None if model_file is None else str(Path(model_file).resolve())
+        keys = [key for key, entry in self._index.items()
+                if (table_key is None or entry['table_key'] == table_key)
+                and (model_path is None or entry['model_file'] == model_path)]
+
+        for key in keys:
+            self._remove(key)
+        self._save_index()
+        return len(keys)
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _evict(self) -> None:
+        # Removes the least recently used entries until the cache fits its maximum size
+
+        size = self.size
+        for key in sorted(self._index, key=lambda key: self._index[key]['last_access']):
+            if size <= self.max_size:
+                break
+            size -= self._index[key]['size']
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        # Removes an entry and its file from the cache
+        entry = self._index.pop(key)
+        (self.directory / entry['file']).unlink(missing_ok=True)
+
+    def _load_index(self) -> dict[str, dict]:
+        # Loads the cache index from the cache directory
+
+        index_file = self.directory / self.INDEX_FILE
+        if not index_file.is_file():
+            return {}
+
+        with open(index_file, encoding='utf-8') as file:
+            return json.load(file)
+
+    def _save_index(self) -> None:
+        # Writes the cache index into the cache directory
+
+        index_file = self.directory / self.INDEX_FILE
+        temporary_file = index_file.with_suffix('.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(self._index, file)
+        os.replace(temporary_file, index_file)
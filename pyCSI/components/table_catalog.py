@@ -0,0 +1,202 @@
+"""
+=====
+PyCSI Table Catalog
+=====
+
+Caches the table keys, import types and field schemas returned by the CSI API Database Tables Interface.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+from typing import Optional
+
+from pyCSI.protocols import IDatabaseTables
+from pyCSI.protocols import BaseModel
+from pyCSI.utils import check_request
+
+
+class TableInfo(NamedTuple):
+    """Table definition as reported by GetAllTables"""
+
+    key: str
+    name: str
+    import_type: int
+    is_empty: bool
+
+
+class TableSchema(NamedTuple):
+    """Field definitions of a table as reported by GetAllFieldsInTable"""
+
+    version: int
+    keys: list[str]
+    names: list[str]
+    units: list[str]
+    importable: list[bool]
+
+    def get_units(self, fields: list[str]) -> list[str]:
+        """Gets the units of the specified fields, unknown fields have no units"""
+
+        units = dict(zip(self.keys, self.units))
+        return [units.get(field, '') for field in fields]
+
+
+class TableCatalog:
+    """Catalog of the database tables available in the model.
+
+    The catalog is filled on demand and cached per software version, model
+    file and lock state, so repeated requests do not reach the CSI API until
+    the model is locked/unlocked or a different model is opened.
+
+    Args:
+        parent (Model): Instance of a PyCSI Model class.
+        database_tables: CSI API Database Tables Interface of the model.
+        cache_file: Optional path to a JSON file used to keep a copy of the
+        catalog between sessions. Defaults to None.
+    """
+
+    def __init__(self, parent, database_tables: IDatabaseTables,
+                 cache_file: Optional[Path | str] = None) -> None:
+        self._parent: BaseModel = parent
+        self._database_tables = database_tables
+        self._model_file: str | None = None
+        self._entries: dict[str, dict] = {}
+        self._cache_file: Path | None = None
+        self.cache_file = cache_file
+
+###################################################################################################################
+# Class properties
+###################################################################################################################
+
+    @property
+    def cache_file(self) -> Path | None:
+        """Gets and sets the JSON file used to keep the catalog between sessions.
+
+        Note:
+            Setting a new file loads the catalog entries stored on it. Set to
+            `None` to keep the catalog in memory only.
+        """
+        return self._cache_file
+
+    @property
+    def state_key(self) -> str:
+        """Key of the current catalog entry, defined by the software version,
+        model file path and lock state of the model"""
+
+        # The full path is used, so models sharing a file name do not share entries of the cache file
+        if self._model_file is None:
+            self._model_file = self._parent.get_file_name(include_path=True)
+
+        lock_state = 'locked' if self._parent.lock else 'unlocked'
+        return f'{self._parent.SOFTWARE} {self._parent.software_version}|{self._model_file}|{lock_state}'
+
+    @cache_file.setter
+    def cache_file(self, new_value: Optional[Path | str]):
+        if new_value is None:
+            self._cache_file = None
+            return
+
+        self._cache_file = Path(new_value)
+        if self._cache_file.is_file():
+            with open(self._cache_file, encoding='utf-8') as file:
+                stored_entries = json.load(file)
+
+            # Entries fetched in this session take precedence
+            for state_key, entry in stored_entries.items():
+                self._entries.setdefault(state_key, entry)
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def get_tables(self) -> dict[str, TableInfo]:
+        """Gets all the tables defined for the model along with their import
+        type and emptiness flag.
+
+        Returns:
+            A dictionary mapping each table key to its `TableInfo`.
+        """
+        entry = self._get_entry()
+        if 'tables' not in entry:
+            request_result = self._database_tables.GetAllTables()
+            check_request(request_result[-1])  # Check API request
+            entry['tables'] = [list(table) for table in zip(*request_result[1:5])]
+            self._save()
+
+        return {table[0]: TableInfo(*table) for table in entry['tables']}
+
+    def get_table(self, table_key: str) -> TableInfo:
+        """Gets the definition of a single table.
+
+        Raises:
+            KeyError: If the table is not defined for the model.
+        """
+        tables = self.get_tables()
+        if table_key not in tables:
+            raise KeyError(f'Table {table_key} is not defined for the model')
+
+        return tables[table_key]
+
+    def get_available_tables(self) -> list[str]:
+        """Gets a list containing the keys of all tables currently available
+        for display"""
+
+        entry = self._get_entry()
+        if 'available' not in entry:
+            request_result = self._database_tables.GetAvailableTables()
+            check_request(request_result[-1])  # Check API request
+            entry['available'] = list(request_result[1])
+            self._save()
+
+        return list(entry['available'])
+
+    def get_fields(self, table_key: str) -> TableSchema:
+        """Gets the field keys, names, units and importability of the
+        specified table.
+
+        Args:
+            table_key: The name of the table which fields will be returned.
+        """
+        fields = self._get_entry().setdefault('fields', {})
+        if table_key not in fields:
+            request_result = self._database_tables.GetAllFieldsInTable(table_key)
+            check_request(request_result[-1])  # Check API request
+            version, _, keys, names, _, units, importable = request_result[:7]
+            fields[table_key] = [version, list(keys), list(names), list(units), list(importable)]
+            self._save()
+
+        return TableSchema(*fields[table_key])
+
+    def clear(self, all_states: bool = False) -> None:
+        """Clears the cached catalog.
+
+        Args:
+            all_states: If `True`, the catalog is cleared for every cached
+            software version and lock state, otherwise only the current entry
+            is cleared. Defaults to `False`.
+        """
+        if all_states:
+            self._entries.clear()
+        else:
+            self._entries.pop(self.state_key, None)
+        self._save()
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _get_entry(self) -> dict:
+        # Gets the catalog entry of the current model state
+        return self._entries.setdefault(self.state_key, {})
+
+    def _save(self) -> None:
+        # Writes the catalog into the cache file, if any
+
+        if self._cache_file is None:
+            return
+
+        temporary_file = self._cache_file.with_suffix(self._cache_file.suffix + '.tmp')
+        with open(temporary_file, 'w', encoding='utf-8') as file:
+            json.dump(self._entries, file)
+        os.replace(temporary_file, self._cache_file)
@@ -0,0 +1,162 @@
+"""
+=====
+PyCSI Table Editor
+=====
+
+Bulk editing of the model through the interactive database tables of the CSI API.
+"""
+
+from typing import NamedTuple
+from typing import Optional
+
+import pandas as pd
+
+from pyCSI.protocols import IDatabaseTables
+from pyCSI.utils import FIELD_STRING
+from pyCSI.utils import check_request
+from pyCSI.utils import flatten_table_dataframe
+from pyCSI.utils import parse_table_array
+
+
+class ImportLog(NamedTuple):
+    """Summary of the import log returned by ApplyEditedTables"""
+
+    fatal_errors: int
+    errors: int
+    warnings: int
+    info: int
+    log: str
+
+
+class TableEditor:
+    """Editing session of the model database tables.
+
+    Tables are loaded for editing as DataFrames, changed DataFrames are
+    queued with `set_table()` and all queued tables are imported in a single
+    `apply()` call. When used as a context manager, queued tables are applied
+    on exit, or cancelled if an exception is raised.
+
+    Note:
+        Please save your model before applying edited tables. If a fatal
+        error occurs the model may be in a corrupted state, see
+        `IDatabaseTables.ApplyEditedTables`.
+
+    Args:
+        tables (Tables): Tables component of the model.
+
+    Example:
+        .. codeblock:: python
+
+            with model.tables.edit() as editor:
+                sections = editor.get_table('Frame Assignments - Sections')
+                sections.loc[sections['Story'] == 'Story1', 'SectProp'] = 'W14X90'
+                editor.set_table('Frame Assignments - Sections', sections)
+
+            print(editor.import_log)
+    """
+
+    # Keywords of the tables that define objects, labels and stories of the model
+    GEOMETRY_TABLES = ('Connectivity', 'Story Definitions')
+
+    def __init__(self, tables) -> None:
+        self._tables = tables
+        self._database_tables: IDatabaseTables = tables._database_tables
+        self._versions: dict[str, int] = {}
+        self.queued_tables: list[str] = []
+        self.import_log: ImportLog | None = None
+
+    def __enter__(self) -> 'TableEditor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.cancel()
+        elif self.queued_tables:
+            try:
+                self.apply()
+            except Exception:
+                self.cancel()
+                raise
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def get_table(self, table_key: str, group: Optional[str] = None) -> pd.DataFrame:
+        """Gets the specified table for editing in dataframe format.
+
+        Args:
+            table_key: The name of the table. The table must be one that can
+            be interactively edited.
+            group: The name of the group for which data will be returned.
+            Defaults to None (all objects).
+
+        Returns:
+            Table data in `DataFrame` format. All fields are returned as the
+            strings read from the table, so values that are not changed are
+            imported back unchanged.
+        """
+        request_result = self._database_tables.GetTableForEditingArray(table_key, group or 'All')
+        check_request(request_result[-1])  # Check API request
+        version, fields, number_records, table_data = request_result[:4]
+        self._versions[table_key] = version
+
+        return parse_table_array(table_data, fields, number_records, field_types=[FIELD_STRING] * len(fields))
+
+    def set_table(self, table_key: str, table_data: pd.DataFrame) -> None:
+        """Queues the specified table to be imported on `apply()`. The table
+        replaces the current data of the table in the model.
+
+        Args:
+            table_key: The name of the table. The table must be one that can
+            be interactively edited.
+            table_data: Table data in `DataFrame` format, each column must be
+            a field key of the table.
+        """
+        version = self._versions.get(table_key)
+        if version is None:
+            version = self._tables.catalog.get_fields(table_key).version
+
+        fields = [str(column) for column in table_data.columns]
+        request_result = self._database_tables.SetTableForEditingArray(
+            table_key, version, fields, len(table_data), flatten_table_dataframe(table_data))
+        check_request(request_result[-1])  # Check API request
+
+        if table_key not in self.queued_tables:
+            self.queued_tables.append(table_key)
+
+    def apply(self, fill_import_log: bool = True) -> ImportLog:
+        """Imports all queued tables into the model.
+
+        Args:
+            fill_import_log: If `True`, the import log messages are returned.
+            Defaults to `True`.
+
+        Returns:
+            An `ImportLog` with the number of fatal errors, errors, warnings
+            and informational messages logged during the import. The log is
+            also kept in `import_log` if the import fails.
+        """
+        request_result = self._database_tables.ApplyEditedTables(fill_import_log)
+        self.import_log = ImportLog(*request_result[:5])
+        applied_tables = list(self.queued_tables)
+        self.queued_tables.clear()
+
+        # Model definitions may have changed even if the import failed, cached table data is no longer valid
+        self._tables._revision += 1
+        self._tables.clear_views()
+
+        # Table keys, schemas and labels only change with the model objects and stories
+        if any(keyword in table_key for table_key in applied_tables for keyword in self.GEOMETRY_TABLES):
+            self._tables._geometry_revision += 1
+            self._tables.catalog.clear()
+
+        check_request(request_result[-1])  # Check API request
+        return self.import_log
+
+    def cancel(self) -> None:
+        """Clears all queued tables without importing them"""
+
+        return_code = self._database_tables.CancelTableEditing()
+        check_request(return_code)
+        self.queued_tables.clear()
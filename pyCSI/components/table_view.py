@@ -0,0 +1,157 @@
+"""
+=====
+PyCSI Table View
+=====
+
+Lazy handles to database tables. Data is only requested to the CSI API once it is accessed.
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Literal
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class TableView:
+    """Lazy view of a database table.
+
+    The view collects the column projection, row filters and load selection
+    of a table request and only fetches the table when the data is accessed
+    through `to_pandas()`, `to_numpy()` or iteration. Views of the same
+    table, group, columns and selection share a single fetch. Views are
+    created with `Tables.view()` or `tables[table_key]`.
+
+    Args:
+        tables (Tables): Tables component of the model.
+        table_key: The name of the table.
+        group: The name of the object's group. Defaults to None (all objects).
+        columns: Field keys to be returned. Defaults to None (all fields).
+        selection: Load cases, combinations and patterns selection, see
+        `Tables.selection()`. Defaults to None (current selection).
+        filters: Row filters applied after the fetch, as pairs of the fields
+        used by the filter (None if unknown) and the filter function.
+        Defaults to None.
+
+    Example:
+        .. codeblock:: python
+
+            drifts = model.tables['Story Drifts'].select('Story', 'OutputCase', 'Drift')
+            x_drifts = drifts.where(Direction='X')
+            x_drifts.to_pandas()
+    """
+
+    def __init__(self, tables, table_key: str, group: Optional[str] = None,
+                 columns: Optional[list[str]] = None, selection: Optional[dict[str, Any]] = None,
+                 filters: Optional[list[tuple]] = None) -> None:
+        self._tables = tables
+        self.table_key = table_key
+        self.group = group
+        self.columns = None if columns is None else list(columns)
+        self.selection = dict(selection or {})
+        self.filters = list(filters or [])
+
+    @property
+    def fetch_columns(self) -> list[str] | None:
+        """Gets the fields requested to the CSI API, the selected columns plus
+        the fields used by the row filters. None if all fields are needed."""
+
+        if self.columns is None:
+            return None
+
+        columns = list(self.columns)
+        for fields, _ in self.filters:
+            if fields is None:
+                return None
+            columns.extend(field for field in fields if field not in columns)
+        return columns
+
+    def __repr__(self) -> str:
+        return f'TableView({self.table_key!r}, group={self.group!r}, columns={self.columns!r})'
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self.to_pandas().itertuples(index=False)
+
+    def __len__(self) -> int:
+        return len(self.to_pandas())
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def select(self, *columns: str) -> 'TableView':
+        """Returns a new view with only the specified columns"""
+        return self._copy(columns=list(columns))
+
+    def where(self, **conditions: Any) -> 'TableView':
+        """Returns a new view with the rows matching the specified field
+        values. List, tuple or set values match any of their items.
+
+        Example:
+            .. codeblock:: python
+
+                view.where(Story=['Story1', 'Story2'], OutputCase='DEAD')
+        """
+        filters = []
+        for field, value in conditions.items():
+            if isinstance(value, (list, tuple, set)):
+                filters.append(({field}, lambda data, field=field, value=value: data[field].isin(value)))
+            else:
+                filters.append(({field}, lambda data, field=field, value=value: data[field] == value))
+        return self._copy(filters=self.filters + filters)
+
+    def filter(self, predicate: Callable[[pd.DataFrame], pd.Series],
+               fields: Optional[list[str]] = None) -> 'TableView':
+        """Returns a new view with the rows where the predicate is `True`.
+
+        Args:
+            predicate: Function that receives the table data and returns a
+            boolean Series.
+            fields: Fields used by the predicate. If not provided and the view
+            has selected columns, all fields are fetched. Defaults to None.
+        """
+        fields = None if fields is None else set(fields)
+        return self._copy(filters=self.filters + [(fields, predicate)])
+
+    def with_selection(self, cases: Literal['all'] | list[str] | None = None,
+                       combos: Literal['all'] | list[str] | None = None,
+                       patterns: Literal['all'] | list[str] | None = None) -> 'TableView':
+        """Returns a new view with the specified load selection, see
+        `Tables.selection()` for accepted values."""
+
+        selection = dict(self.selection)
+        for name, value in (('cases', cases), ('combos', combos), ('patterns', patterns)):
+            if value is not None:
+                selection[name] = value
+        return self._copy(selection=selection)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Gets the table data in `DataFrame` format, fetching it if it has
+        not been requested before"""
+
+        table_data = self._tables._fetch_view(self)
+        for _, predicate in self.filters:
+            table_data = table_data[predicate(table_data)]
+
+        if self.columns is not None:
+            table_data = table_data[self.columns]
+        return table_data.reset_index(drop=True)
+
+    def to_numpy(self) -> np.ndarray:
+        """Gets the table data as a NumPy array"""
+        return self.to_pandas().to_numpy()
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _copy(self, **kwargs) -> 'TableView':
+        # Returns a copy of the view with the specified attributes replaced
+
+        attributes = {'group': self.group, 'columns': self.columns, 'selection': self.selection,
+                      'filters': self.filters}
+        attributes.update(kwargs)
+        return TableView(self._tables, self.table_key, **attributes)
@@ -7,15 +7,53 @@ The Tables component gives access to the CSI API Database Tables Interface.
 """
 
 
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
 from typing import Literal
+from typing import NamedTuple
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from pyCSI.components.table_cache import TableResultsCache
+from pyCSI.components.table_catalog import TableCatalog
+from pyCSI.components.table_editor import TableEditor
+from pyCSI.components.table_view import TableView
 from pyCSI.protocols import IDatabaseTables
 from pyCSI.protocols import BaseModel
 from pyCSI.utils import check_request
+from pyCSI.utils import parse_table_array
+
+
+class TableRequest(NamedTuple):
+    """Table request used by `Tables.get_tables()`
+
+    Args:
+        table_key: The name of the table which data will be returned.
+        group: The name of the object\'s group for which the data will be
+        returned. Defaults to None (all objects).
+        load_cases: Load cases selected for display, see `Tables.load_cases`.
+        If not provided the selection active when the request is made is
+        used. Defaults to None.
+        load_combos: Load combinations selected for display, see
+        `Tables.load_combos`. Defaults to None.
+        load_patterns: Load patterns selected for display, see
+        `Tables.load_patterns`. Defaults to None.
+        name: Key of the returned table in the results dictionary. Defaults
+        to the table key.
+        columns: Fields to be returned, see `Tables.get_table_dataframe()`.
+        Defaults to None (all fields).
+    """
+
+    table_key: str
+    group: Optional[str] = None
+    load_cases: Literal['all'] | list[str] | None = None
+    load_combos: Literal['all'] | list[str] | None = None
+    load_patterns: Literal['all'] | list[str] | None = None
+    name: Optional[str] = None
+    columns: Optional[list[str]] = None
 
 
 class Tables:
@@ -31,6 +69,18 @@ class Tables:
         self._load_cases = None
         self._load_combos = None
         self._load_patterns = None
+        self._catalog = TableCatalog(parent, self._database_tables)
+        self._batch_stats: dict[str, int] = {}
+        self._results_cache: TableResultsCache | None = None
+        self._selection_calls = 0
+        self._all_names: dict[int, list[str]] | None = None
+        self._view_data: dict[tuple, pd.DataFrame] = {}
+        self._view_state_key: str | None = None
+        self._revision = 0
+        self._geometry_revision = 0
+
+    def __getitem__(self, table_key: str) -> TableView:
+        return self.view(table_key)
 
 ###################################################################################################################
 # Class initialize setup
@@ -40,6 +90,57 @@ class Tables:
 # Class properties
 ###################################################################################################################
 
+    @property
+    def catalog(self) -> TableCatalog:
+        """Gets the catalog with the cached table keys and field schemas of
+        the model. See `TableCatalog` for available methods."""
+        return self._catalog
+
+    @property
+    def batch_stats(self) -> dict[str, int]:
+        """Gets the statistics of the last `get_tables()` call.
+
+        Returns:
+            A dictionary containing the following:
+            - tables: Number of tables fetched.
+            - selection_calls: Number of `Set*SelectedForDisplay` calls made.
+            - selection_calls_saved: Number of `Set*SelectedForDisplay` calls
+            saved compared to setting the three selections for every table.
+        """
+        return dict(self._batch_stats)
+
+    @property
+    def revision(self) -> int:
+        """Gets the number of table edits applied to the model through
+        `edit()`. Used to invalidate data derived from the model tables."""
+        return self._revision
+
+    @property
+    def geometry_revision(self) -> int:
+        """Gets the number of table edits applied to the geometry or
+        connectivity of the model, see `TableEditor.GEOMETRY_TABLES`. Used to
+        invalidate data derived from the model objects and stories."""
+        return self._geometry_revision
+
+    @property
+    def results_cache(self) -> TableResultsCache | None:
+        """Gets and sets the on-disk cache used to serve repeated table
+        requests without reaching the CSI API.
+
+        Note:
+            Accepted values are:
+            - An instance of `TableResultsCache`.
+            - `None`: Disable the results cache.
+
+        Example:
+            .. codeblock:: python
+
+                from pyCSI.components import TableResultsCache
+
+                model.tables.results_cache = TableResultsCache('table_cache', max_size_mb=2048)
+        """
+        return self._results_cache
+
     @property
     def load_cases(self) -> list[str]:
         """Gets and sets the load cases set for display in table returned data.
@@ -109,54 +210,49 @@ class Tables:
 
     @load_cases.setter
     def load_cases(self, new_value: Literal['all'] | list[str] | None):
-        if new_value is None:
-            # If None, set new_value to empty list
-            new_value = []
-
-        if isinstance(new_value, str):
-            if new_value.lower() != 'all':
-                raise ValueError('Assigned value not valid')
+        new_value = self._get_selection_value(new_value, 0)
 
-            # if 'all', select all cases
-            new_value = self._parent.get_load_cases()
+        # Skip the API request if the selection is already active
+        if self._load_cases is not None and sorted(new_value) == sorted(self._load_cases):
+            return
 
         _, return_code = self._database_tables.SetLoadCasesSelectedForDisplay(new_value)
         check_request(return_code)
         self._load_cases = new_value
+        self._selection_calls += 1
 
     @load_combos.setter
     def load_combos(self, new_value: Literal['all'] | list[str] | None):
-        if new_value is None:
-            # If None, set new_value to empty list
-            new_value = []
-
-        if isinstance(new_value, str):
-            if new_value.lower() != 'all':
-                raise ValueError('Assigned value not valid')
+        new_value = self._get_selection_value(new_value, 1)
 
-            # if 'all', select all combos
-            new_value = self._parent.get_load_combos()
+        # Skip the API request if the selection is already active
+        if self._load_combos is not None and sorted(new_value) == sorted(self._load_combos):
+            return
 
         _, return_code = self._database_tables.SetLoadCombinationsSelectedForDisplay(new_value)
         check_request(return_code)
         self._load_combos = new_value
+        self._selection_calls += 1
 
     @load_patterns.setter
     def load_patterns(self, new_value: Literal['all'] | list[str] | None):
-        if new_value is None:
-            # If None, set new_value to empty list
-            new_value = []
+        new_value = self._get_selection_value(new_value, 2)
 
-        if isinstance(new_value, str):
-            if new_value.lower() != 'all':
-                raise ValueError('Assigned value not valid')
-
-            # if 'all', select all patterns
-            new_value = self._parent.get_load_patterns()
+        # Skip the API request if the selection is already active
+        if self._load_patterns is not None and sorted(new_value) == sorted(self._load_patterns):
+            return
 
         _, return_code = self._database_tables.SetLoadPatternsSelectedForDisplay(new_value)
         check_request(return_code)
         self._load_patterns = new_value
+        self._selection_calls += 1
+
+    @results_cache.setter
+    def results_cache(self, new_value: TableResultsCache | None):
+        if isinstance(new_value, TableResultsCache) or new_value is None:
+            self._results_cache = new_value
+        else:
+            raise ValueError('New value must be an instance of TableResultsCache class')
 
 ###################################################################################################################
 # Class methods
@@ -165,14 +261,12 @@ class Tables:
     def get_available_tables(self) -> list[str]:
         """Gets a list containing the names of all available tables in the model"""
 
-        request_result = self._database_tables.GetAvailableTables()
-        return_code = request_result[-1]
-        check_request(return_code)  # Check API request
-
-        return request_result[1]
+        return self.catalog.get_available_tables()
 
     def get_table_dataframe(self, table_key: str, group: Optional[str] = None,
-                            include_all_headers: bool = False) -> pd.DataFrame:
+                            include_all_headers: bool = False, use_cache: bool = True,
+                            categorical: bool | list[str] = True,
+                            columns: Optional[list[str]] = None) -> pd.DataFrame:
         """Gets the specified table in a dataframe format.
 
         Arguments:
@@ -186,43 +280,373 @@ class Tables:
             available fields for the specified table. If the field has no data
             it will be filled with NaN values. Defaults to `False`
 
+            use_cache: If `True` and a `results_cache` is set, the table is
+            served from the cache when the same request was made for the
+            current model file. Models that are unlocked or not saved yet
+            are not cached. Defaults to `True`.
+
+            categorical: Fields returned as `Categorical` columns. If `True`,
+            low cardinality fields such as Story, OutputCase, CaseType,
+            StepType, Label and UniqueName are returned as categorical. If
+            `False`, no categorical columns are returned. Defaults to `True`.
+
+            columns: List of field keys to be returned. Only the requested
+            fields are transferred from the CSI API. If not provided, all
+            fields are returned. Defaults to None.
+
         Returns:
             Table data in `DataFrame` format.
+
+        Raises:
+            ValueError: If any of the requested columns is not a field of the
+            table.
         """
         if group is None:
             # If group is None, select all objects for display
             group = 'All'
 
+        # Get the table field schema from the catalog
+        schema = self.catalog.get_fields(table_key)
+
+        if columns is not None:
+            # Check that requested columns are fields of the table
+            columns = list(columns)
+            unknown_fields = [column for column in columns if column not in schema.keys]
+            if unknown_fields:
+                raise ValueError(f'Fields {unknown_fields} are not valid for table {table_key}. '
+                                 f'Valid fields are {schema.keys}')
+
+        # Serve the table from the results cache. Unsaved and unlocked models are not cached, results only exist
+        # on locked models and edits applied since the model was opened are part of the key
+        cache_key = None
+        model_file = self._parent.get_file_name(include_path=True) if self.results_cache is not None else ''
+        if use_cache and model_file and self._parent.lock:
+            cache_key = self.results_cache.get_key(model_file, table_key, group, *self._get_selection(),
+                                                   include_all_headers=include_all_headers,
+                                                   categorical=categorical, columns=columns,
+                                                   revision=self._revision)
+            table_data = self.results_cache.get(cache_key)
+            if table_data is not None:
+                return table_data
+
         # Get table from API
-        field_keys = []
+        field_keys = [] if columns is None else columns
         request_result = self._database_tables.GetTableForDisplayArray(table_key, field_keys, group)
         return_code = request_result[-1]
         check_request(return_code)  # Check API request
         headers = request_result[2]
         number_records = request_result[3]
-        data = np.array(request_result[4])
-        data = data.reshape(number_records, len(headers))
 
-        # Get table data into dataframe
-        table_data = pd.DataFrame(data, columns=headers)
-
-        # Turn number values into numbers
-        for column in table_data:
-            try:
-                table_data[column] = pd.to_numeric(table_data[column])
-            except ValueError:
-                pass
+        # Get table data into a typed dataframe
+        units = schema.get_units(headers)
+        table_data = parse_table_array(request_result[4], headers, number_records, units=units,
+                                       categorical=categorical)
 
         if include_all_headers:
-            # Get all available headers for the table
-            request_result = self._database_tables.GetAllFieldsInTable(table_key)
-            return_code = request_result[-1]
-            check_request(return_code)  # Check API request
-            field_keys = request_result[2]
-
             # Insert missing fields into dataframe
-            missing_fields = {field: index for index, field in enumerate(field_keys) if field not in headers}
+            fields = schema.keys if columns is None else columns
+            missing_fields = {field: index for index, field in enumerate(fields) if field not in headers}
             for field, index in missing_fields.items():
                 table_data.insert(index, field, np.nan)
 
+        if columns is not None:
+            # Return fields in the requested order
+            table_data = table_data[[column for column in columns if column in table_data.columns]]
+
+        if cache_key is not None:
+            self.results_cache.put(cache_key, table_data, table_key, model_file)
+
         return table_data
+
+    def get_tables(self, requests: list[str | TableRequest | tuple]) -> dict[str, pd.DataFrame]:
+        """Gets several tables in dataframe format, setting up the load
+        selection for display as few times as possible.
+
+        Requests are grouped by their load cases, combinations and patterns
+        selection, so tables sharing a selection are fetched one after the
+        other. The selection active before the call is restored at the end.
+        See `batch_stats` for the number of API calls saved.
+
+        Arguments:
+            requests: List of table requests. Each request can be a table key,
+            a `TableRequest` or a tuple with the `TableRequest` arguments.
+
+        Returns:
+            A dictionary mapping each request name (defaults to the table key)
+            to its table data in `DataFrame` format.
+        """
+        # Normalize requests and resolve the selection of each of them
+        current_selection = self._get_selection()
+        requests_selection: list[tuple[TableRequest, tuple]] = []
+        with self._keep_all_names():
+            for request in requests:
+                if isinstance(request, str):
+                    request = TableRequest(request)
+                elif not isinstance(request, TableRequest):
+                    request = TableRequest(*request)
+
+                selection = []
+                for index, value in enumerate(request[2:5]):
+                    value = current_selection[index] if value is None else self._get_selection_value(value, index)
+                    selection.append(tuple(sorted(value)))
+                requests_selection.append((request, tuple(selection)))
+
+        # Check that returned names are unique
+        names = [request.name or request.table_key for request, _ in requests_selection]
+        if len(set(names)) != len(names):
+            raise ValueError('Table requests must have unique names')
+
+        # Order requests to minimize the changes of selection
+        ordered_requests = []
+        active_selection = current_selection
+        pending_requests = list(requests_selection)
+        while pending_requests:
+            next_selection = min(pending_requests, key=lambda item: _count_changes(active_selection, item[1]))[1]
+            ordered_requests.extend(item for item in pending_requests if item[1] == next_selection)
+            pending_requests = [item for item in pending_requests if item[1] != next_selection]
+            active_selection = next_selection
+
+        # Get tables
+        initial_calls = self._selection_calls
+        tables = {}
+        with self.selection():
+            for request, selection in ordered_requests:
+                self.load_cases, self.load_combos, self.load_patterns = (list(value) for value in selection)
+                tables[request.name or request.table_key] = self.get_table_dataframe(request.table_key, request.group,
+                                                                                     columns=request.columns)
+        selection_calls = self._selection_calls - initial_calls
+
+        self._batch_stats = {'tables': len(tables),
+                             'selection_calls': selection_calls,
+                             'selection_calls_saved': 3 * len(tables) - selection_calls}
+
+        # Return tables in the requested order
+        return {name: tables[name] for name in names}
+
+    def iter_table_dataframes(self, table_key: str, groups: Optional[list[str]] = None,
+                              load_cases: Literal['all'] | list[str] | None = None,
+                              load_combos: Literal['all'] | list[str] | None = None,
+                              output_path: Optional[Path | str] = None,
+                              columns: Optional[list[str]] = None) -> Iterator[pd.DataFrame]:
+        """Gets the specified table in chunks, one dataframe at a time.
+
+        The table is requested once per load case and load combination, or
+        once per group if a list of groups is provided, so the peak memory is
+        set by the size of a single chunk instead of the whole table. The
+        selection active before the call is restored once the iteration ends.
+
+        Arguments:
+            table_key: The name of the table which data will be returned.
+
+            groups: List of groups used to split the table. If provided, each
+            chunk contains the data of a single group for the current load
+            selection. Defaults to None.
+
+            load_cases: Load cases used to split the table, see `load_cases`.
+            If not provided the current selection is used. Ignored if groups
+            are provided. Defaults to None.
+
+            load_combos: Load combinations used to split the table, see
+            `load_combos`. If not provided the current selection is used.
+            Ignored if groups are provided. Defaults to None.
+
+            output_path: If provided, each chunk is also written as a file of
+            a Parquet dataset in this folder. Defaults to None.
+
+            columns: List of field keys to be returned, see
+            `get_table_dataframe()`. Defaults to None (all fields).
+
+        Yields:
+            Table data of each non-empty chunk in `DataFrame` format.
+
+        Example:
+            .. codeblock:: python
+
+                for displacements in model.tables.iter_table_dataframes('Joint Displacements'):
+                    peaks.append(displacements.groupby('UniqueName')['Ux'].max())
+        """
+        if output_path is not None:
+            output_path = Path(output_path)
+            output_path.mkdir(parents=True, exist_ok=True)
+
+        # Define the selection and group of each chunk
+        if groups is not None:
+            chunks = [(None, group) for group in groups]
+        else:
+            if load_cases is None:
+                load_cases = self.load_cases
+            if load_combos is None:
+                load_combos = self.load_combos
+            chunks = [({'cases': [case], 'combos': []}, None) for case in self._get_selection_value(load_cases, 0)]
+            chunks += [({'cases': [], 'combos': [combo]}, None) for combo in self._get_selection_value(load_combos, 1)]
+
+        with self.selection():
+            for index, (selection, group) in enumerate(chunks):
+                if selection is not None:
+                    self.load_cases = selection['cases']
+                    self.load_combos = selection['combos']
+
+                table_data = self.get_table_dataframe(table_key, group, columns=columns)
+                if table_data.empty:
+                    continue
+
+                if output_path is not None:
+                    table_data.to_parquet(output_path / f'part-{index:05d}.parquet', index=False)
+
+                yield table_data
+
+    def view(self, table_key: str, group: Optional[str] = None, columns: Optional[list[str]] = None,
+             cases: Literal['all'] | list[str] | None = None,
+             combos: Literal['all'] | list[str] | None = None,
+             patterns: Literal['all'] | list[str] | None = None) -> TableView:
+        """Gets a lazy view of the specified table. The table is not requested
+        to the CSI API until the view data is accessed, see `TableView`.
+
+        Arguments:
+            table_key: The name of the table.
+            group: The name of the object\'s group. Defaults to None.
+            columns: List of field keys to be returned. Defaults to None.
+            cases: Load cases to display, see `selection()`. Defaults to None.
+            combos: Load combinations to display, see `selection()`. Defaults
+            to None.
+            patterns: Load patterns to display, see `selection()`. Defaults
+            to None.
+
+        Returns:
+            A `TableView` of the table.
+        """
+        selection = {name: value for name, value in (('cases', cases), ('combos', combos), ('patterns', patterns))
+                     if value is not None}
+        return TableView(self, table_key, group, columns, selection)
+
+    def edit(self) -> TableEditor:
+        """Starts an editing session of the model database tables. See
+        `TableEditor` for available methods.
+
+        Returns:
+            A `TableEditor`, which can be used as a context manager that
+            applies the queued tables on exit.
+        """
+        return TableEditor(self)
+
+    def clear_views(self) -> None:
+        """Clears the table data shared by the table views"""
+        self._view_data.clear()
+
+    @contextmanager
+    def selection(self, cases: Literal['all'] | list[str] | None = None,
+                  combos: Literal['all'] | list[str] | None = None,
+                  patterns: Literal['all'] | list[str] | None = None) -> Iterator['Tables']:
+        """Context manager that sets the load selection for display and
+        restores the previous selection on exit. Only the selections that
+        change are sent to the CSI API.
+
+        Arguments:
+            cases: Load cases to display, see `load_cases`. If not provided
+            the current selection is kept. Defaults to None.
+            combos: Load combinations to display, see `load_combos`. If not
+            provided the current selection is kept. Defaults to None.
+            patterns: Load patterns to display, see `load_patterns`. If not
+            provided the current selection is kept. Defaults to None.
+
+        Example:
+            .. codeblock:: python
+
+                with model.tables.selection(cases=['DEAD', 'LIVE'], combos=[]):
+                    reactions = model.tables.get_table_dataframe('Joint Reactions')
+        """
+        previous_selection = (list(self.load_cases), list(self.load_combos), list(self.load_patterns))
+        try:
+            if cases is not None:
+                self.load_cases = cases
+            if combos is not None:
+                self.load_combos = combos
+            if patterns is not None:
+                self.load_patterns = patterns
+            yield self
+        finally:
+            self.load_cases, self.load_combos, self.load_patterns = previous_selection
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _get_selection(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        # Gets the current load cases, combinations and patterns selection
+
+        return (tuple(sorted(self.load_cases)),
+                tuple(sorted(self.load_combos)),
+                tuple(sorted(self.load_patterns)))
+
+    def _fetch_view(self, view: TableView) -> pd.DataFrame:
+        # Gets the data of a table view. Data is shared between views of the
+        # same table, group, columns and selection
+
+        selection = []
+        for index, name in enumerate(('cases', 'combos', 'patterns')):
+            value = view.selection.get(name)
+            value = self._get_selection()[index] if value is None else self._get_selection_value(value, index)
+            selection.append(tuple(sorted(value)))
+
+        # Data of a previous model state is not used again
+        state_key = self.catalog.state_key
+        if state_key != self._view_state_key:
+            self._view_data.clear()
+            self._view_state_key = state_key
+
+        columns = view.fetch_columns
+        base_key = (state_key, view.table_key, view.group or 'All', tuple(selection))
+        key = base_key + (None if columns is None else tuple(columns),)
+        if key not in self._view_data:
+            full_key = base_key + (None,)
+            if full_key in self._view_data:
+                # Project the data from the full table
+                self._view_data[key] = self._view_data[full_key][columns]
+            else:
+                with self.selection(*(list(value) for value in selection)):
+                    self._view_data[key] = self.get_table_dataframe(view.table_key, view.group, columns=columns)
+
+        return self._view_data[key]
+
+    def _get_selection_value(self, value: Literal['all'] | list[str] | None, index: int) -> list[str]:
+        # Resolves a load cases (0), combinations (1) or patterns (2) selection value into a list of names
+
+        if value is None:
+            # If None, select nothing
+            return []
+
+        if not isinstance(value, str):
+            return list(value)
+
+        if value.lower() != 'all':
+            raise ValueError('Assigned value not valid')
+
+        # If 'all', select all names defined in the model. Names are only
+        # kept within a single request, see `_keep_all_names()`
+        get_names = (self._parent.get_load_cases, self._parent.get_load_combos, self._parent.get_load_patterns)
+        if self._all_names is None:
+            return get_names[index]()
+
+        if index not in self._all_names:
+            self._all_names[index] = get_names[index]()
+        return list(self._all_names[index])
+
+    @contextmanager
+    def _keep_all_names(self) -> Iterator[None]:
+        # Keeps the names resolved for 'all' selections until the outermost request ends, names are fetched again
+        # afterwards since load cases, combinations and patterns can be added to an unlocked model
+
+        if self._all_names is not None:
+            yield
+            return
+
+        self._all_names = {}
+        try:
+            yield
+        finally:
+            self._all_names = None
+
+
+def _count_changes(selection: tuple, new_selection: tuple) -> int:
+    # Counts the number of selections that differ between two selection sets
+    return sum(value != new_value for value, new_value in zip(selection, new_selection))
@@ -5,7 +5,11 @@ from .load_types import LoadCaseType
 from .load_types import LoadTypeEnum
 
 # Miscellaneous enumerators
+from .miscellaneous import CaseStatus
 from .miscellaneous import ItemType
+from .miscellaneous import ObjectType
+from .miscellaneous import SolverProcessType
+from .miscellaneous import SolverType
 
 # Return Code enumerator
 from .returncode import ReturnCode
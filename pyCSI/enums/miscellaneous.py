@@ -19,3 +19,40 @@ class ItemType(IntEnum):
     OBJECTS = 0
     GROUP = 1
     SELECTED_OBJECTS = 2
+
+
+class ObjectType(IntEnum):
+    '''Object type class enumerator, as reported by GroupDef.GetAssignments'''
+
+    POINT = 1
+    FRAME = 2
+    CABLE = 3
+    TENDON = 4
+    AREA = 5
+    SOLID = 6
+    LINK = 7
+
+
+class CaseStatus(IntEnum):
+    '''Analysis case status class enumerator, as reported by Analyze.GetCaseStatus'''
+
+    NOT_RUN = 1
+    COULD_NOT_START = 2
+    NOT_FINISHED = 3
+    FINISHED = 4
+
+
+class SolverType(IntEnum):
+    '''Analysis solver type class enumerator'''
+
+    STANDARD = 0
+    ADVANCED = 1
+    MULTI_THREADED = 2
+
+
+class SolverProcessType(IntEnum):
+    '''Analysis solver process type class enumerator'''
+
+    AUTO = 0
+    GUI_PROCESS = 1
+    SEPARATE_PROCESS = 2
@@ -0,0 +1,401 @@
+"""
+=====
+PyCSI Analysis Farm
+=====
+
+Runs the analysis of a queue of model files on several instances of the CSI software in parallel.
+"""
+
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+
+import comtypes
+
+from pyCSI.components.tables import TableRequest
+from pyCSI.model import ETABSModel
+from pyCSI.utils import APIBadRequest
+from pyCSI.utils import APIConnectionError
+
+
+class FarmJob(NamedTuple):
+    """Analysis job of the farm, see `AnalysisFarm.submit()`"""
+
+    job_id: int
+    model_file: str
+    tables: tuple
+    save: bool
+    timeout: float | None
+    cases: tuple | None = None
+
+
+class FarmResult(NamedTuple):
+    """Result of an analysis job, see `AnalysisFarm.results()`"""
+
+    job_id: int
+    model_file: str
+    tables: dict[str, Any]
+    error: str | None
+    timed_out: bool
+    attempts: int
+    worker: int
+    elapsed: float
+
+
+class AnalysisFarm:
+    """Pool of CSI software instances that run a queue of analysis jobs.
+
+    Each worker thread owns one instance of the software and runs its jobs
+    one after the other: opens the model, runs the analysis, extracts the
+    requested tables and saves the model. Jobs exceeding their timeout or
+    crashing the instance have their instance terminated and restarted.
+    Crashed jobs are retried, failed analysis requests and timed out jobs
+    are not.
+
+    Args:
+        n_workers: Number of instances run in parallel.
+        instance_factory: Function that receives the worker number and
+        returns a connected model instance (e.g. an `ETABSModel`). Defaults to
+        None, which launches hidden instances of `model_class`.
+        instance_terminator: Function that kills a hung or crashed instance.
+        Defaults to None, which kills the process of the instance `pid`.
+        model_class: Model class used by the default factory. Defaults to
+        `ETABSModel`.
+        version: Software version used by the default factory to find the
+        executable. Defaults to None.
+        job_timeout: Default timeout of each job in seconds. Defaults to None
+        (no timeout).
+        max_retries: Number of times a job is retried after an instance
+        crash. Defaults to 1.
+        start_timeout: Maximum time to wait for a launched instance to be
+        available, in seconds. Defaults to 120.
+
+    Example:
+        .. codeblock:: python
+
+            with AnalysisFarm(8, version=21, job_timeout=3600) as farm:
+                for model_file in model_files:
+                    farm.submit(model_file, tables=['Story Drifts'])
+
+                for result in farm.results():
+                    print(result.model_file, result.error or result.tables['Story Drifts'].shape)
+
+            print(farm.stats)
+    """
+
+    def __init__(self, n_workers: int, instance_factory: Optional[Callable[[int], Any]] = None,
+                 instance_terminator: Optional[Callable[[Any], None]] = None,
+                 model_class: type = ETABSModel, version: Optional[int] = None,
+                 job_timeout: Optional[float] = None, max_retries: int = 1, start_timeout: float = 120) -> None:
+        if n_workers < 1:
+            raise ValueError('The number of workers must be at least 1')
+
+        self.n_workers = n_workers
+        self.job_timeout = job_timeout
+        self.max_retries = max_retries
+        self.start_timeout = start_timeout
+        self.model_class = model_class
+        self.version = version
+        self._instance_factory = instance_factory or self._launch_instance
+        self._instance_terminator = instance_terminator or self._terminate_instance
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._instances: dict[int, Any] = {}
+        self._running_jobs: dict[int, tuple[FarmJob, float]] = {}
+        self._timed_out_workers: set[int] = set()
+        self._next_job_id = 0
+        self._pending = 0
+        self._stop = threading.Event()
+        self._close_instances = True
+        self._monitor: threading.Thread | None = None
+        self._start_time: float | None = None
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'timed_out': 0, 'retried': 0,
+                       'restarts': 0, 'busy_time': 0.0}
+
+    def __enter__(self) -> 'AnalysisFarm':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+###################################################################################################################
+# Class properties
+###################################################################################################################
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Gets the farm statistics.
+
+        Returns:
+            A dictionary with the number of submitted, completed, failed,
+            timed out and retried jobs, instance restarts, elapsed time,
+            throughput in jobs per hour and worker utilization.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        elapsed = 0.0 if self._start_time is None else time.perf_counter() - self._start_time
+        finished = stats['completed'] + stats['failed'] + stats['timed_out']
+        stats['pending'] = self._pending
+        stats['elapsed'] = elapsed
+        stats['throughput'] = finished / elapsed * 3600 if elapsed else 0.0
+        stats['utilization'] = stats['busy_time'] / (elapsed * self.n_workers) if elapsed else 0.0
+        return stats
+
+###################################################################################################################
+# Class methods
+###################################################################################################################
+
+    def start(self) -> None:
+        """Starts the worker threads. Instances are launched by each worker
+        when it receives its first job."""
+
+        if self._workers:
+            return
+
+        self._stop.clear()
+        self._start_time = time.perf_counter()
+        for worker in range(self.n_workers):
+            thread = threading.Thread(target=self._work, args=(worker,), name=f'pyCSI-farm-{worker}', daemon=True)
+            thread.start()
+            self._workers.append(thread)
+
+        self._monitor = threading.Thread(target=self._watch, name='pyCSI-farm-monitor', daemon=True)
+        self._monitor.start()
+
+    def submit(self, model_file: Path | str, tables: Optional[list[str | TableRequest | tuple]] = None,
+               save: bool = True, timeout: Optional[float] = None, cases: Optional[list[str]] = None) -> int:
+        """Adds a model file to the job queue.
+
+        Args:
+            model_file: Path of the model file to be analyzed.
+            tables: Table requests extracted after the analysis, see
+            `Tables.get_tables()`. Defaults to None (no tables).
+            save: If `True`, the model is saved after the analysis. Defaults
+            to `True`.
+            timeout: Timeout of the job in seconds. Defaults to None (the
+            farm `job_timeout`).
+            cases: If provided, only these load cases are set to run.
+            Defaults to None (run flags saved in the model).
+
+        Returns:
+            The job ID.
+        """
+        self.start()
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            self._pending += 1
+            self._stats['submitted'] += 1
+
+        job = FarmJob(job_id, str(model_file), tuple(tables or ()), save,
+                      self.job_timeout if timeout is None else timeout, None if cases is None else tuple(cases))
+        self._jobs.put((job, 1))
+        return job_id
+
+    def results(self, timeout: Optional[float] = None) -> Iterator[FarmResult]:
+        """Yields the results of the submitted jobs as they finish, until no
+        job is pending.
+
+        Args:
+            timeout: Maximum time to wait for each result in seconds.
+            Defaults to None (no limit).
+
+        Raises:
+            TimeoutError: If no result is received within the timeout.
+        """
+        while self._pending:
+            try:
+                result = self._results.get(timeout=timeout)
+            except queue.Empty as error:
+                raise TimeoutError(f'No analysis job finished within {timeout} seconds') from error
+
+            with self._lock:
+                self._pending -= 1
+            yield result
+
+    def map(self, model_files: list[Path | str], tables: Optional[list[str | TableRequest | tuple]] = None,
+            save: bool = True) -> Iterator[FarmResult]:
+        """Submits the model files with the same table requests and yields
+        their results as they finish. See `submit()`."""
+
+        for model_file in model_files:
+            self.submit(model_file, tables, save)
+        return self.results()
+
+    def shutdown(self, close_instances: bool = True) -> None:
+        """Stops the workers once the queued jobs are finished.
+
+        Args:
+            close_instances: If `True`, the software instances are closed
+            without saving by their worker threads. Defaults to `True`.
+        """
+        self._close_instances = close_instances
+        for _ in self._workers:
+            self._jobs.put(None)
+        for thread in self._workers:
+            thread.join()
+
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+
+        self._workers.clear()
+        self._monitor = None
+
+###################################################################################################################
+# Miscellaneous Methods
+###################################################################################################################
+
+    def _work(self, worker: int) -> None:
+        # Worker loop, runs queued jobs on the worker instance
+
+        comtypes.CoInitialize()
+        try:
+            # Retries of crashed jobs run on the same worker before the next queued item, so they are not left
+            # behind the stop sentinels of shutdown()
+            item = self._jobs.get()
+            while item is not None:
+                item = self._run_job(worker, *item) or self._jobs.get()
+
+            # Instances are closed from the thread that created them
+            instance = self._instances.pop(worker, None) if self._close_instances else None
+            if instance is not None:
+                self._close_instance(instance)
+        finally:
+            comtypes.CoUninitialize()
+
+    def _run_job(self, worker: int, job: FarmJob, attempt: int) -> tuple[FarmJob, int] | None:
+        # Runs a single job and restarts the instance if it crashed or timed out. Returns the job and attempt to
+        # be retried, if any
+
+        start_time = time.perf_counter()
+        tables, error, crashed = {}, None, False
+        try:
+            instance = self._instances.get(worker)
+            if instance is None:
+                instance = self._instance_factory(worker)
+                self._instances[worker] = instance
+
+            with self._lock:
+                self._running_jobs[worker] = (job, start_time)
+
+            instance.file.open_file(job.model_file)
+            if job.cases is not None:
+                instance.analysis.set_load_cases_to_run(True, list(job.cases), exclusive=True)
+            instance.analysis.run_analysis()
+            if job.tables:
+                tables = instance.tables.get_tables(list(job.tables))
+            if job.save:
+                instance.file.save()
+        except (APIBadRequest, FileNotFoundError, ValueError, KeyError) as exception:
+            error = f'{type(exception).__name__}: {exception}'
+        except Exception as exception:  # pylint: disable=broad-except
+            error = f'{type(exception).__name__}: {exception}'
+            crashed = True
+        finally:
+            with self._lock:
+                self._running_jobs.pop(worker, None)
+                timed_out = worker in self._timed_out_workers
+                self._timed_out_workers.discard(worker)
+
+        elapsed = time.perf_counter() - start_time
+        if timed_out or crashed:
+            self._restart_instance(worker)
+
+        with self._lock:
+            self._stats['busy_time'] += elapsed
+            if timed_out:
+                self._stats['timed_out'] += 1
+                error = f'TimeoutError: Job exceeded {job.timeout} seconds'
+            elif crashed and attempt <= self.max_retries:
+                self._stats['retried'] += 1
+                return job, attempt + 1
+            elif error is not None:
+                self._stats['failed'] += 1
+            else:
+                self._stats['completed'] += 1
+
+        self._results.put(FarmResult(job.job_id, job.model_file, tables, error, timed_out, attempt, worker, elapsed))
+        return None
+
+    def _watch(self) -> None:
+        # Monitor loop, terminates the instances running jobs longer than their timeout
+
+        while not self._stop.wait(0.5):
+            now = time.perf_counter()
+            with self._lock:
+                expired = [worker for worker, (job, start_time) in self._running_jobs.items()
+                           if job.timeout is not None and now - start_time > job.timeout
+                           and worker not in self._timed_out_workers]
+                self._timed_out_workers.update(expired)
+
+            for worker in expired:
+                instance = self._instances.get(worker)
+                if instance is not None:
+                    self._instance_terminator(instance)
+
+    def _restart_instance(self, worker: int) -> None:
+        # Discards the instance of a worker, a new one is created for the next job
+
+        instance = self._instances.pop(worker, None)
+        if instance is not None:
+            self._instance_terminator(instance)
+        with self._lock:
+            self._stats['restarts'] += 1
+
+    def _close_instance(self, instance: Any) -> None:
+        # Closes an instance without saving, terminating it if it does not respond
+
+        try:
+            instance.close_application(save_model=False)
+        except Exception:  # pylint: disable=broad-except
+            self._instance_terminator(instance)
+
+    def _launch_instance(self, worker: int) -> ETABSModel:
+        # Default instance factory, launches a hidden instance and attaches to it by its process ID
+
+        model = self.model_class(self.version)
+        if model.api_path is None:
+            raise APIConnectionError('A software version is required to launch instances of the analysis farm')
+
+        process = subprocess.Popen([model.api_path])  # pylint: disable=consider-using-with
+        deadline = time.perf_counter() + self.start_timeout
+        while True:
+            try:
+                model.get_model(active_model=True, pid=process.pid)
+                break
+            except Exception as error:  # pylint: disable=broad-except
+                if process.poll() is not None or time.perf_counter() > deadline:
+                    process.kill()
+                    raise APIConnectionError(f'Instance {worker} of {model.SOFTWARE} could not be started') \
+                        from error
+                time.sleep(1)
+
+        model.visible = False
+        return model
+
+    def _terminate_instance(self, instance: Any) -> None:
+        # Default instance terminator, kills the process of the instance
+
+        pid = getattr(instance, 'pid', None)
+        if pid is None:
+            return
+
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
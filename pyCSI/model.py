@@ -63,6 +63,7 @@ class ETABSModel:
         self._groups: Groups | None = None
         self._tables: Tables | None = None
         self.connected_to_model: bool = False
+        self.pid: int | None = None
 
     ###################################################################################################################
     # Properties getters
@@ -163,10 +164,10 @@ class ETABSModel:
     def group(self) -> Groups:
         '''Class property that gives access to group operations'''
 
-        if self._group is None:
+        if self._groups is None:
             raise_model_error(self.SOFTWARE)
 
-        return self._group
+        return self._groups
 
     @property
     def tables(self) -> Tables:
@@ -260,11 +261,11 @@ class ETABSModel:
             raise ValueError('New value must be an instance of File class')
 
     @group.setter
-    def group(self, new_value: Group | None):
-        if isinstance(new_value, Group) or new_value is None:
-            self._group = new_value
+    def group(self, new_value: Groups | None):
+        if isinstance(new_value, Groups) or new_value is None:
+            self._groups = new_value
         else:
-            raise ValueError('New value must be an instance of Group class')
+            raise ValueError('New value must be an instance of Groups class')
 
     @tables.setter
     def tables(self, new_value: Tables | None):
@@ -310,12 +311,15 @@ class ETABSModel:
     # API methods
     ###################################################################################################################
 
-    def get_model(self, active_model: bool = True, file_location: Optional[str] = None, visibility: bool = True):
+    def get_model(self, active_model: bool = True, file_location: Optional[str] = None, visibility: bool = True,
+                  pid: Optional[int] = None):
         '''Connects to an active or a new window of the software
 
         Keyword Arguments:
             active_model -- Optional. If True, connects to active instance of the model, otherwise creates a
                             new window (default: True)
+            pid -- Optional. Process ID of the running instance to connect to. If not provided the active instance
+                    is used. Ignored if active_model is False (default = None)
 
             The following arguments will be ignored if active_model is True
             file_location -- Optional. Complete path to model file as string. If not provided a new model will
@@ -325,7 +329,7 @@ class ETABSModel:
         '''
         if active_model:
             # Attach to active model
-            self._connect_to_active_model()
+            self._connect_to_active_model(pid)
         else:
             # Creates a new instance
             self._create_new_instance(visibility)
@@ -334,11 +338,16 @@ class ETABSModel:
             # Open the specified model
             self.file.open_file(file_location)
 
-    def _connect_to_active_model(self) -> None:
-        '''Attach to active running instance of the program'''
-        self._api_object = self._helper.get_api_object()
+    def _connect_to_active_model(self, pid: Optional[int] = None) -> None:
+        '''Attach to active running instance of the program
+
+        Arguments:
+            pid -- Process ID of the instance, if not provided the active instance is used
+        '''
+        self._api_object = self._helper.get_api_object(pid)
 
         if self._api_object is not None:
+            self.pid = pid
             self._set_model_object(self._api_object.SapModel)
             print(f'Successfully connected to {self.get_file_name()}')
         else:
@@ -365,6 +374,14 @@ class ETABSModel:
             model_object -- Instance of Sap Model Interface
         '''
 
+        # Keep the cache files and measured case costs of the previous model components
+        previous_tables: Tables | None = getattr(self, 'tables', None)
+        previous_analysis: Analysis | None = getattr(self, 'analysis', None)
+        catalog_cache_file = previous_tables.catalog.cache_file if previous_tables is not None else None
+        results_cache = previous_tables.results_cache if previous_tables is not None else None
+        fingerprint_file = previous_analysis.fingerprint_file if previous_analysis is not None else None
+        case_costs = previous_analysis.case_costs if previous_analysis is not None else {}
+
         self._model_object = model_object
         self.connected_to_model = model_object is not None
 
@@ -375,9 +392,13 @@ class ETABSModel:
             self._length_unit = self.get_units()[1].name
             self._temperature_unit = self.get_units()[2].name
             self.analysis = Analysis(self)
+            self.analysis.fingerprint_file = fingerprint_file
+            self.analysis._case_costs = case_costs
             self.file = File(self)
-            self.group = Group(self)
+            self.group = Groups(self)
             self.tables = Tables(self)
+            self.tables.catalog.cache_file = catalog_cache_file
+            self.tables.results_cache = results_cache
         else:
             self._lock = None
             self._force_unit = None
@@ -533,6 +554,7 @@ class ETABSModel:
             self._api_object.ApplicationExit(save_model)
             self._set_model_object(None)
             self._api_object = None
+            self.pid = None
 
 
 class SAPModel(ETABSModel):
@@ -30,6 +30,21 @@ class IAnalysis(Protocol):
         '''
         ...
 
+    def GetCaseStatus(self) -> tuple[int, list[str], list[int], int]:
+        '''Retrieves the status for all analysis cases
+
+        Returns: A list containing the following
+            number_items: int -- The number of load cases for which the status is reported \n
+            case_name: list[str] -- A list containing the names of each analysis case for which the status is reported \n
+            status: list[int] -- A list containing the status of each analysis case
+                1. Not run
+                2. Could not start
+                3. Not finished
+                4. Finished
+            return_code: int -- Returns zero if the status is successfully retrieved; otherwise returns a nonzero value
+            '''
+        ...
+
     def GetRunCaseFlag(self) -> tuple[int, list[str], list[bool], int]:
         '''Retrieves the run flags for all analysis cases
 
@@ -41,6 +56,23 @@ class IAnalysis(Protocol):
             '''
         ...
 
+    def GetSolverOption_3(self) -> tuple[int, int, int, int, int, str, int]:
+        '''Retrieves the model solver options
+
+        Returns: A list containing the following
+            solver_type: int -- The solver type: 0 Standard, 1 Advanced, 2 Multi-threaded \n
+            solver_process_type: int -- The process the analysis is run in: 0 Auto, 1 GUI process,
+                                        2 Separate process \n
+            number_parallel_runs: int -- Number of analysis cases run in parallel, between -8 and 8 excluding -1.
+                                         Negative values and 0 are automatic, 1 is serial \n
+            response_file_size_max_mb: int -- Maximum size of a response file in MB, 0 or less for the default \n
+            number_analysis_threads: int -- Number of threads used by the solver, 0 or less for automatic \n
+            stiff_case: str -- Name of the load case used to compute the stiffness for the analysis, blank if none \n
+            return_code: int -- Returns zero if the options are successfully retrieved; otherwise returns a nonzero
+                                value
+        '''
+        ...
+
     def RunAnalysis(self) -> int:
         '''Runs the analysis
 
@@ -63,3 +95,21 @@ class IAnalysis(Protocol):
             Returns zero if the flag is successfully set; otherwise it returns a nonzero value
         '''
         ...
+
+    def SetSolverOption_3(self, solver_type: int, solver_process_type: int, number_parallel_runs: int,
+                          response_file_size_max_mb: int, number_analysis_threads: int, stiff_case: str) -> int:
+        '''Sets the model solver options
+
+        Arguments:
+            solver_type -- The solver type: 0 Standard, 1 Advanced, 2 Multi-threaded \n
+            solver_process_type -- The process the analysis is run in: 0 Auto, 1 GUI process, 2 Separate process \n
+            number_parallel_runs -- Number of analysis cases run in parallel, between -8 and 8 excluding -1.
+                                    Negative values and 0 are automatic, 1 is serial \n
+            response_file_size_max_mb -- Maximum size of a response file in MB, 0 or less for the default \n
+            number_analysis_threads -- Number of threads used by the solver, 0 or less for automatic \n
+            stiff_case -- Name of the load case used to compute the stiffness for the analysis, blank if none
+
+        Returns:
+            Returns zero if the options are successfully set; otherwise it returns a nonzero value
+        '''
+        ...
@@ -32,6 +32,7 @@ class BaseModel(Protocol):
     visible: bool
     api_path: str | None
     lock: bool | None
+    software_version: int
 
     ##################################################################################################################
     # Setup
@@ -219,13 +219,15 @@ class IDatabaseTables(Protocol):
         '''
         ...
 
-    def SetTableForEditingArray(self, table_name: str) -> tuple[int, int]:
+    def SetTableForEditingArray(self, table_name: str, table_version: int, field_keys_included: list[str],
+                                number_records: int, table_data: list[str]) -> tuple[int, list[str], list[str], int]:
         '''Reads a table from a string array and adds it to a stored table list until either the 
             ApplyEditedTables() or CancelTableEditing method is used
 
         Arguments:
             table_name: str -- The name of the table for which data is requested. The table must be one that can be 
                             interactively edited. \n
+            table_version: int -- The version number of the specified table \n
             field_keys_included: list[str] -- A list containing the field keys associated with the specified table
                                                 for which data is reported in the order it is reported in the TableData
                                                 array \n
@@ -234,6 +236,8 @@ class IDatabaseTables(Protocol):
 
         Returns: A list containing the following
             table_version: int -- The version number of the specified table \n
+            field_keys_included: list[str] -- A list containing the field keys included in the table data \n
+            table_data: list[str] -- A list containing the table data \n
             return_code: int -- Returns 0 if the function executes correctly, otherwise returns nonzero
         '''
         ...
@@ -6,3 +6,7 @@ from .validation_utils import raise_api_error
 from .validation_utils import raise_model_error
 from .validation_utils import check_valid_model
 from .validation_utils import check_request
+from .table_utils import FIELD_STRING
+from .table_utils import flatten_table_dataframe
+from .table_utils import infer_field_types
+from .table_utils import parse_table_array
@@ -0,0 +1,188 @@
+"""
+=====
+PyCSI Table utilities
+=====
+
+Parsing utilities for the flat string arrays returned by the CSI API Database Tables Interface
+"""
+
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Field types used to describe the columns of a table
+FIELD_FLOAT = 'float'
+FIELD_INT = 'int'
+FIELD_STRING = 'str'
+
+# Low cardinality fields returned as categorical columns by default
+CATEGORICAL_FIELDS = frozenset({'Story', 'OutputCase', 'CaseType', 'StepType', 'Label', 'UniqueName'})
+
+
+def get_blank_mask(data: np.ndarray) -> np.ndarray:
+    '''Returns a boolean array marking the blank (empty string or None) values of the data array
+
+    Arguments:
+        data -- Object array with the table data
+    '''
+    return (data == '') | pd.isnull(data)
+
+
+def infer_field_types(data: np.ndarray, units: Optional[Sequence[str]] = None) -> list[str]:
+    '''Decides the type of each column of a table once, before the data is converted
+
+    Fields with units reported by GetAllFieldsInTable are considered floats, the remaining fields are typed from
+    the first non-blank value of the column.
+
+    Arguments:
+        data -- Two dimensional object array with the table data, one column per field
+        units -- Optional. Units string of each field in the same order as the data columns (default: {None})
+
+    Returns:
+        A list with the field type of each column (FIELD_FLOAT, FIELD_INT or FIELD_STRING)
+    '''
+    number_records, number_fields = data.shape
+    field_types = []
+    for index in range(number_fields):
+        if units is not None and units[index]:
+            field_types.append(FIELD_FLOAT)
+            continue
+
+        if number_records == 0:
+            field_types.append(FIELD_FLOAT)
+            continue
+
+        # Sample the first non-blank value of the column
+        sample = data[0, index]
+        if sample is None or sample == '':
+            filled = np.flatnonzero(~get_blank_mask(data[:, index]))
+            if filled.size == 0:
+                field_types.append(FIELD_FLOAT)
+                continue
+            sample = data[filled[0], index]
+        field_types.append(_get_value_type(sample))
+
+    return field_types
+
+
+def parse_table_array(table_data: Sequence[str], fields: Sequence[str], number_records: int,
+                      field_types: Optional[Sequence[str]] = None,
+                      units: Optional[Sequence[str]] = None,
+                      categorical: bool | Iterable[str] = False) -> pd.DataFrame:
+    '''Converts the flat table data returned by the CSI API into a typed DataFrame
+
+    Numeric columns are converted in a single vectorized pass, blank values are returned as NaN. Columns that
+    cannot be converted to numbers are kept as strings.
+
+    Arguments:
+        table_data -- Flat list with the table data, excluding headers, returned row by row
+        fields -- Field keys included in the table data
+        number_records -- The number of records of the table data
+        field_types -- Optional. Type of each field, see infer_field_types(). If not provided the types will be
+                        inferred from the units or from the data (default: {None})
+        units -- Optional. Units string of each field, used to infer the field types (default: {None})
+        categorical -- Optional. Fields returned as categorical columns. If True, the fields in CATEGORICAL_FIELDS
+                        are used (default: {False})
+
+    Returns:
+        Table data in DataFrame format
+    '''
+    data = np.array(table_data, dtype=object).reshape(number_records, len(fields))
+
+    if field_types is None:
+        field_types = infer_field_types(data, units)
+
+    if categorical is True:
+        categorical = CATEGORICAL_FIELDS
+    categorical = set(categorical or ())
+
+    columns = {}
+    for index, (field, field_type) in enumerate(zip(fields, field_types)):
+        column = data[:, index]
+        if field in categorical:
+            column = _to_categorical(column, field_type)
+        elif field_type != FIELD_STRING:
+            column = _to_numeric(column, field_type)
+        columns[field] = column
+
+    return pd.DataFrame(columns, columns=list(fields))
+
+
+def flatten_table_dataframe(table_data: pd.DataFrame) -> list[str]:
+    '''Converts a DataFrame into the flat string array used by the CSI API, row by row. Missing values are
+    returned as blank strings
+
+    Arguments:
+        table_data -- Table data in DataFrame format
+
+    Returns:
+        A flat list with the table data, excluding headers
+    '''
+    values = table_data.astype(object).to_numpy()
+    blank = pd.isnull(values)
+    values = values.astype(str)
+    values[blank] = ''
+    return values.ravel().tolist()
+
+
+def _get_value_type(value) -> str:
+    # Gets the field type of a single string value
+
+    try:
+        int(value)
+        return FIELD_INT
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        float(value)
+        return FIELD_FLOAT
+    except (TypeError, ValueError):
+        return FIELD_STRING
+
+
+def _to_numeric(column: np.ndarray, field_type: str) -> np.ndarray:
+    # Converts an object column into a numeric column, blank values are turned into NaN
+
+    try:
+        # Fast path, column without blank values
+        values = column.astype(np.float64)
+        has_blanks = False
+    except (TypeError, ValueError):
+        blank = get_blank_mask(column)
+        has_blanks = bool(blank.any())
+        if not has_blanks:
+            # Column is not numeric, keep the original values
+            return column
+        try:
+            values = np.where(blank, 'nan', column).astype(np.float64)
+        except (TypeError, ValueError):
+            return column
+
+    if field_type == FIELD_INT and not has_blanks:
+        integers = values.astype(np.int64)
+        if np.array_equal(integers, values):
+            return integers
+
+    return values
+
+
+def _to_categorical(column: np.ndarray, field_type: str) -> pd.Categorical:
+    # Converts an object column into a categorical column, categories are typed as the field
+
+    if field_type != FIELD_STRING:
+        # Blank values are missing (code -1) in numeric fields, as in non-categorical columns
+        column = np.where(get_blank_mask(column), None, column)
+
+    codes, categories = pd.factorize(column)
+    if field_type != FIELD_STRING:
+        typed_categories = _to_numeric(categories.astype(object), field_type)
+        if pd.Index(typed_categories).is_unique:
+            categories = typed_categories
+
+    return pd.Categorical.from_codes(codes, categories)
+
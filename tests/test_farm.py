@@ -0,0 +1,154 @@
+"""
+Tests of the AnalysisFarm scheduling against a fake instance factory
+
+Usage:
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('comtypes')
+
+from pyCSI.farm import AnalysisFarm  # noqa: E402  pylint: disable=wrong-import-position
+from pyCSI.utils import APIBadRequest  # noqa: E402  pylint: disable=wrong-import-position
+
+
+class FakeInstance:
+    '''Fake software instance, the behavior of each job is set by its model file name'''
+
+    crashed_files: set[str] = set()
+
+    def __init__(self, worker: int) -> None:
+        self.worker = worker
+        self.thread = threading.get_ident()
+        self.closed_from: int | None = None
+        self.killed = threading.Event()
+        self.model_file: str | None = None
+        self.file = _FakeFile(self)
+        self.analysis = _FakeAnalysis(self)
+        self.tables = _FakeTables(self)
+
+    def close_application(self, save_model: bool = True) -> None:
+        self.closed_from = threading.get_ident()
+
+
+class _FakeFile:
+    def __init__(self, instance: FakeInstance) -> None:
+        self.instance = instance
+
+    def open_file(self, model_file: str) -> None:
+        self.instance.model_file = model_file
+
+    def save(self) -> None:
+        pass
+
+
+class _FakeAnalysis:
+    def __init__(self, instance: FakeInstance) -> None:
+        self.instance = instance
+
+    def run_analysis(self) -> None:
+        model_file = self.instance.model_file
+        if 'hang' in model_file:
+            self.instance.killed.wait()
+            raise OSError('The RPC server is unavailable')
+        if 'crash' in model_file and model_file not in FakeInstance.crashed_files:
+            FakeInstance.crashed_files.add(model_file)
+            raise OSError('The instance stopped responding')
+        if 'bad' in model_file:
+            raise APIBadRequest('Analysis could not be run', 1)
+        time.sleep(0.01)
+
+
+class _FakeTables:
+    def __init__(self, instance: FakeInstance) -> None:
+        self.instance = instance
+
+    def get_tables(self, requests: list) -> dict:
+        return {request: f'{self.instance.model_file}|{request}' for request in requests}
+
+
+@pytest.fixture(name='instances')
+def fixture_instances() -> list[FakeInstance]:
+    FakeInstance.crashed_files = set()
+    return []
+
+
+def create_farm(instances: list[FakeInstance], **kwargs) -> AnalysisFarm:
+    '''Creates a farm of two workers with fake instances, created instances are appended to the list'''
+
+    def factory(worker: int) -> FakeInstance:
+        instance = FakeInstance(worker)
+        instances.append(instance)
+        return instance
+
+    return AnalysisFarm(2, instance_factory=factory, instance_terminator=lambda instance: instance.killed.set(),
+                        **kwargs)
+
+
+def run_farm(instances: list[FakeInstance], model_files: list[str], **kwargs) -> tuple[dict, dict]:
+    '''Runs the model files on a farm of fake instances and returns the results by model file and the stats'''
+
+    farm = create_farm(instances, **kwargs)
+    with farm:
+        results = {result.model_file: result for result in farm.map(model_files, ['Story Drifts'])}
+    return results, farm.stats
+
+
+def test_jobs_return_requested_tables(instances):
+    results, stats = run_farm(instances, ['a.edb', 'b.edb', 'c.edb'])
+
+    assert results['a.edb'].tables == {'Story Drifts': 'a.edb|Story Drifts'}
+    assert all(result.error is None and result.attempts == 1 for result in results.values())
+    assert stats['submitted'] == stats['completed'] == 3
+    assert stats['pending'] == 0
+
+
+def test_timed_out_job_restarts_instance(instances):
+    results, stats = run_farm(instances, ['hang.edb', 'a.edb'], job_timeout=1)
+
+    assert results['hang.edb'].timed_out
+    assert results['hang.edb'].error.startswith('TimeoutError')
+    assert results['a.edb'].error is None
+    assert stats['timed_out'] == 1
+    assert stats['restarts'] == 1
+
+
+def test_crashed_job_is_retried(instances):
+    results, stats = run_farm(instances, ['crash.edb'])
+
+    assert results['crash.edb'].error is None
+    assert results['crash.edb'].attempts == 2
+    assert stats['retried'] == 1
+    assert stats['restarts'] == 1
+
+
+def test_failed_request_is_not_retried(instances):
+    results, stats = run_farm(instances, ['bad.edb'], max_retries=3)
+
+    assert results['bad.edb'].error.startswith('APIBadRequest')
+    assert results['bad.edb'].attempts == 1
+    assert stats['failed'] == 1
+    assert stats['retried'] == 0
+
+
+def test_instances_are_closed_by_their_worker_thread(instances):
+    run_farm(instances, ['a.edb', 'b.edb', 'c.edb', 'd.edb'])
+
+    assert instances
+    assert all(instance.closed_from == instance.thread for instance in instances)
+
+
+def test_shutdown_runs_pending_retries(instances):
+    farm = create_farm(instances)
+    farm.submit('crash.edb')
+    farm.shutdown()
+
+    results = list(farm.results(timeout=2))
+    assert len(results) == 1
+    assert results[0].error is None
+    assert results[0].attempts == 2
+    assert farm.stats['pending'] == 0